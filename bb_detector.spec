@@ -57,7 +57,8 @@ a = Analysis(
         # mss
         'mss',
         'mss.windows',
-        # bettercam (optional)
+        # DXGI capture backends (optional)
+        'dxcam',
         'bettercam',
     ],
     hookspath=[],
@@ -1,8 +1,22 @@
 # bb_detector/capture.py
+import logging
+import threading
+import time
+from typing import Callable
+
+import cv2
 import numpy as np
 from .platform_utils import get_platform
 
+log = logging.getLogger(__name__)
+
+
 class ScreenCapture:
+    # Desktop Duplication backends (bettercam is a dxcam fork with the same API)
+    DXGI_BACKENDS = ('dxcam', 'bettercam')
+    # Regions whose last DXGI frame is kept for static-screen repeats
+    DXGI_LAST_FRAMES = 4
+
     def __init__(self, monitor: int = 0, fps: int = 10):
         self.monitor = monitor
         self.fps = fps
@@ -13,11 +27,42 @@ class ScreenCapture:
         self._monitor_info = None
         self._resolution = None
 
+        # Reusable RGB output buffers for the mss backend (full frame / region)
+        self._frame_buf: np.ndarray | None = None
+        self._region_buf: np.ndarray | None = None
+        # Grayscale output buffers (OCR only needs luminance)
+        self._gray_buf: np.ndarray | None = None
+        self._region_gray_buf: np.ndarray | None = None
+        # DXGI grab() returns None while the screen is unchanged; the last
+        # frame per region is repeated in that case. Desktop Duplication is
+        # not thread-safe, and the stream thread and UI calibration both grab.
+        self._dxgi_lock = threading.Lock()
+        self._dxgi_last: dict[tuple | None, np.ndarray] = {}
+
+        # Background stream: the producer thread fills one of three preallocated
+        # buffers while the consumer reads another, so OCR can lag behind capture
+        self._stream_thread: threading.Thread | None = None
+        self._stream_stop = threading.Event()
+        self._stream_lock = threading.Lock()
+        self._stream_bufs: list[np.ndarray | None] = [None, None, None]
+        self._stream_front: int | None = None    # newest complete frame
+        self._stream_reading: int | None = None  # frame handed to the consumer
+        self._stream_seq = 0
+
         self._init_backend()
 
     def _init_backend(self):
-        # Try bettercam on Windows
+        # Try DXGI Desktop Duplication on Windows: dxcam first, then bettercam
         if self._platform == 'windows':
+            try:
+                import dxcam
+                self._camera = dxcam.create(output_idx=self.monitor, output_color='RGB')
+                if self._camera is not None:
+                    self._backend = 'dxcam'
+                    return
+            except (ImportError, Exception):
+                pass
+
             try:
                 import bettercam
                 self._backend = 'bettercam'
@@ -34,52 +79,249 @@ class ScreenCapture:
         monitor_idx = min(self.monitor + 1, len(self._sct.monitors) - 1)
         self._monitor_info = self._sct.monitors[monitor_idx]
         self._resolution = (self._monitor_info['width'], self._monitor_info['height'])
+        self._frame_buf = np.empty(
+            (self._monitor_info['height'], self._monitor_info['width'], 3), dtype=np.uint8
+        )
 
     def start(self):
-        if self._backend == 'bettercam' and self._camera:
-            self._camera.start(target_fps=self.fps)
+        # DXGI cameras are polled on demand with grab(region=...), so only the
+        # requested area is copied; no full-frame capture thread is started.
+        pass
 
     def stop(self):
-        if self._backend == 'bettercam' and self._camera:
-            self._camera.stop()
+        self.stop_stream()
+
+    def start_stream(self, grab_fn: Callable[[], np.ndarray | None] | None = None):
+        """Capture frames on a background thread at self.fps.
+
+        Args:
+            grab_fn: Frame source, defaults to grab_gray(). Returning None
+                skips the tick (e.g. while detection is paused).
+        """
+        if self._stream_thread is not None:
+            return
+
+        self._stream_stop.clear()
+        self._stream_thread = threading.Thread(
+            target=self._stream_loop,
+            args=(grab_fn or self.grab_gray,),
+            name='capture',
+            daemon=True
+        )
+        self._stream_thread.start()
+
+    def stop_stream(self):
+        if self._stream_thread is None:
+            return
+
+        self._stream_stop.set()
+        self._stream_thread.join(timeout=1.0)
+        self._stream_thread = None
+
+    def get_latest(self) -> tuple[int, np.ndarray | None]:
+        """Return (sequence number, newest streamed frame) without copying.
+
+        The frame stays untouched until the next get_latest() call.
+        """
+        with self._stream_lock:
+            if self._stream_front is None:
+                return self._stream_seq, None
+            self._stream_reading = self._stream_front
+            return self._stream_seq, self._stream_bufs[self._stream_front]
+
+    def _stream_loop(self, grab_fn: Callable[[], np.ndarray | None]):
+        interval = 1.0 / self.fps
+
+        while not self._stream_stop.is_set():
+            tick_start = time.monotonic()
+
+            try:
+                frame = grab_fn()
+            except Exception as e:
+                log.warning(f"[Capture] Stream error: {e}")
+                frame = None
+
+            if frame is not None:
+                self._publish(frame)
+
+            elapsed = time.monotonic() - tick_start
+            self._stream_stop.wait(max(0.0, interval - elapsed))
+
+    def _publish(self, frame: np.ndarray):
+        """Copy frame into a free buffer and make it the newest one."""
+        with self._stream_lock:
+            idx = next(
+                i for i in range(len(self._stream_bufs))
+                if i != self._stream_front and i != self._stream_reading
+            )
+
+        buf = self._stream_bufs[idx]
+        if buf is None or buf.shape != frame.shape:
+            buf = self._stream_bufs[idx] = np.empty_like(frame)
+        np.copyto(buf, frame)
+
+        with self._stream_lock:
+            self._stream_front = idx
+            self._stream_seq += 1
 
     def grab(self) -> np.ndarray | None:
-        if self._backend == 'bettercam':
-            frame = self._camera.get_latest_frame()
+        if self._backend in self.DXGI_BACKENDS:
+            frame = self._dxgi_grab()
             if frame is not None:
                 self._resolution = (frame.shape[1], frame.shape[0])
             return frame
 
         elif self._backend == 'mss':
             screenshot = self._sct.grab(self._monitor_info)
-            frame = np.array(screenshot)
-            # Remove alpha channel and convert BGRA -> RGB
-            frame = frame[:, :, :3]
-            frame = frame[:, :, ::-1].copy()
-            return frame
+            self._frame_buf = self._bgra_to_rgb(screenshot, self._frame_buf)
+            return self._frame_buf
+
+        return None
+
+    def grab_into(self, out: np.ndarray | None = None) -> np.ndarray | None:
+        """Grab the full monitor as RGB into a caller-owned buffer.
+
+        Unlike grab(), the result is never touched by later grabs. ``out`` is
+        reused when it matches the frame size, otherwise a new array is made.
+        """
+        if self._backend in self.DXGI_BACKENDS:
+            frame = self.grab()
+            if frame is None:
+                return None
+            if out is None or out.shape != frame.shape:
+                out = np.empty(frame.shape, dtype=np.uint8)
+            np.copyto(out, frame)
+            return out
+
+        elif self._backend == 'mss':
+            screenshot = self._sct.grab(self._monitor_info)
+            return self._bgra_to_rgb(screenshot, out)
 
         return None
 
     def grab_region(self, x: int, y: int, w: int, h: int) -> np.ndarray | None:
-        if self._backend == 'bettercam':
+        if self._backend in self.DXGI_BACKENDS:
+            # Only the region is copied out of the duplicated surface
+            return self._dxgi_grab((x, y, x + w, y + h))
+
+        elif self._backend == 'mss':
+            screenshot = self._sct.grab(self._region_for(x, y, w, h))
+            self._region_buf = self._bgra_to_rgb(screenshot, self._region_buf)
+            return self._region_buf
+
+        return None
+
+    def grab_gray(self) -> np.ndarray | None:
+        """Grab the full monitor as a single-channel grayscale image."""
+        if self._backend in self.DXGI_BACKENDS:
             frame = self.grab()
-            if frame is not None:
-                return frame[y:y+h, x:x+w]
-            return None
+            if frame is None:
+                return None
+            self._gray_buf = self._rgb_to_gray(frame, self._gray_buf)
+            return self._gray_buf
 
         elif self._backend == 'mss':
-            region = {
-                'left': self._monitor_info['left'] + x,
-                'top': self._monitor_info['top'] + y,
-                'width': w,
-                'height': h
-            }
-            screenshot = self._sct.grab(region)
-            frame = np.array(screenshot)[:, :, :3][:, :, ::-1].copy()
-            return frame
+            screenshot = self._sct.grab(self._monitor_info)
+            self._gray_buf = self._bgra_to_gray(screenshot, self._gray_buf)
+            return self._gray_buf
+
+        return None
+
+    def grab_region_gray(self, x: int, y: int, w: int, h: int) -> np.ndarray | None:
+        """Grab a screen region as a single-channel grayscale image."""
+        if self._backend in self.DXGI_BACKENDS:
+            frame = self.grab_region(x, y, w, h)
+            if frame is None:
+                return None
+            self._region_gray_buf = self._rgb_to_gray(frame, self._region_gray_buf)
+            return self._region_gray_buf
+
+        elif self._backend == 'mss':
+            screenshot = self._sct.grab(self._region_for(x, y, w, h))
+            self._region_gray_buf = self._bgra_to_gray(screenshot, self._region_gray_buf)
+            return self._region_gray_buf
 
         return None
 
+    def _dxgi_grab(self, region: tuple[int, int, int, int] | None = None) -> np.ndarray | None:
+        """Grab (left, top, right, bottom) from a DXGI camera, or the full output.
+
+        Desktop Duplication reports no frame while the screen is static; the
+        last frame for the same region is returned then.
+        """
+        if region is not None:
+            width = getattr(self._camera, 'width', None)
+            height = getattr(self._camera, 'height', None)
+            if width and height:
+                left, top, right, bottom = region
+                region = (
+                    max(0, left), max(0, top), min(right, width), min(bottom, height)
+                )
+                if region[0] >= region[2] or region[1] >= region[3]:
+                    return None
+
+        with self._dxgi_lock:
+            frame = self._camera.grab(region=region)
+            last = self._dxgi_last
+            if frame is None:
+                return last.get(region)
+
+            # Most recently used last; a few regions (stream, full frame,
+            # calibration) are kept so alternating grabs don't evict each other
+            last.pop(region, None)
+            last[region] = frame
+            if len(last) > self.DXGI_LAST_FRAMES:
+                del last[next(iter(last))]
+            return frame
+
+    def _region_for(self, x: int, y: int, w: int, h: int) -> dict:
+        """mss region dict for monitor-relative coordinates."""
+        return {
+            'left': self._monitor_info['left'] + x,
+            'top': self._monitor_info['top'] + y,
+            'width': w,
+            'height': h
+        }
+
+    @staticmethod
+    def _rgb_to_gray(rgb: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+        """Convert an RGB frame (or strided crop) to grayscale into ``out``."""
+        h, w = rgb.shape[:2]
+        if out is None or out.shape != (h, w):
+            out = np.empty((h, w), dtype=np.uint8)
+
+        return cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY, dst=out)
+
+    @staticmethod
+    def _bgra_to_gray(screenshot, out: np.ndarray | None) -> np.ndarray:
+        """Convert an mss BGRA screenshot straight to grayscale (one OpenCV pass)."""
+        w, h = screenshot.size
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(h, w, 4)
+
+        if out is None or out.shape != (h, w):
+            out = np.empty((h, w), dtype=np.uint8)
+
+        return cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY, dst=out)
+
+    @staticmethod
+    def _bgra_to_rgb(screenshot, out: np.ndarray | None) -> np.ndarray:
+        """Convert an mss BGRA screenshot to RGB in a single pass.
+
+        The raw buffer is wrapped without copying and channels are written
+        straight into ``out``, which is reallocated only when the size changes.
+        The returned array is reused by the next grab - copy it to keep it.
+        """
+        w, h = screenshot.size
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(h, w, 4)
+
+        if out is None or out.shape != (h, w, 3):
+            out = np.empty((h, w, 3), dtype=np.uint8)
+
+        out[..., 0] = bgra[..., 2]
+        out[..., 1] = bgra[..., 1]
+        out[..., 2] = bgra[..., 0]
+        return out
+
     @property
     def resolution(self) -> tuple[int, int]:
         if self._resolution:
@@ -1,5 +1,6 @@
 # bb_detector/config.py
 import json
+import os
 from pathlib import Path
 from typing import Any
 
@@ -15,7 +16,9 @@ DEFAULT_CONFIG = {
         "consecutive_hits": 2,
         "cooldown_seconds": 5.0,
         "monitor_index": 0,
-        "fuzzy_ocr_matching": True
+        "fuzzy_ocr_matching": True,
+        "ocr_max_height": 96,
+        "ocr_min_height": 48
     },
     "games": {
         "Bloodborne": {
@@ -135,6 +138,10 @@ DEFAULT_CONFIG = {
         "toggle_detection": "ctrl+shift+p",
         "show_overlay": "ctrl+shift+o"
     },
+    "ui": {
+        "fps": 30,
+        "vsync": False
+    },
     "overlay": {
         "enabled": True,
         "position": [50, 50],
@@ -144,19 +151,24 @@ DEFAULT_CONFIG = {
 }
 
 
+# DEFAULT_CONFIG is pure JSON, so a json round-trip is the cheapest deep copy
+_FROZEN_DEFAULT = json.dumps(DEFAULT_CONFIG)
+
+_MISSING = object()
+
+
 class Config:
     def __init__(self, path: Path | str | None = None):
         if path is None:
             path = Path.home() / ".bb-detector" / "config.json"
         self.path = Path(path)
-        self._data = self._deep_copy(DEFAULT_CONFIG)
+        self._data = json.loads(_FROZEN_DEFAULT)
 
-    def _deep_copy(self, obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {k: self._deep_copy(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._deep_copy(v) for v in obj]
-        return obj
+        # get() memo: key -> (version, resolved value); writes bump _version
+        self._version = 0
+        self._get_cache: dict[str, tuple[int, Any]] = {}
+        # _version as of the last load/save; anything newer is unsaved
+        self._saved_version = 0
 
     def load(self) -> bool:
         if not self.path.exists():
@@ -166,6 +178,8 @@ class Config:
             with open(self.path, 'r', encoding='utf-8') as f:
                 loaded = json.load(f)
             self._merge(self._data, loaded)
+            self._version += 1
+            self._saved_version = self._version
             return True
         except (json.JSONDecodeError, IOError):
             return False
@@ -177,26 +191,67 @@ class Config:
             else:
                 base[key] = value
 
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes since the last load/save."""
+        return self._version != self._saved_version
+
     def save(self) -> bool:
+        version = self._version
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
         try:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, 'w', encoding='utf-8') as f:
+            # Write aside and swap in, so a crash mid-write can't truncate the config
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(self._data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._saved_version = version
             return True
         except IOError:
             return False
 
+    def save_if_dirty(self) -> bool:
+        """save() only if something changed; True if nothing needed saving."""
+        return self.save() if self.dirty else True
+
     def get(self, key: str, default: Any = None) -> Any:
-        keys = key.split('.')
+        cached = self._get_cache.get(key)
+        if cached is not None and cached[0] == self._version:
+            value = cached[1]
+        else:
+            value = self._resolve(key)
+            self._get_cache[key] = (self._version, value)
+
+        if value is _MISSING or value is None:
+            return default
+        return value
+
+    def _resolve(self, key: str) -> Any:
         value = self._data
 
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
+
+        return value
+
+    @property
+    def settings(self) -> dict:
+        """The live ``settings`` section, without a dotted-path lookup."""
+        return self._data.setdefault('settings', {})
+
+    def view(self, prefix: str) -> dict:
+        """Shallow snapshot of the section at ``prefix`` (empty if missing)."""
+        section = self.get(prefix)
+        return dict(section) if isinstance(section, dict) else {}
 
-        return value if value is not None else default
+    def get_game_config(self) -> dict:
+        """The current game's section (empty if the game is unknown)."""
+        game = self._data.get('current_game') or 'Bloodborne'
+        game_config = self._data.get('games', {}).get(game)
+        return game_config if isinstance(game_config, dict) else {}
 
     def set(self, key: str, value: Any):
         keys = key.split('.')
@@ -208,3 +263,4 @@ class Config:
             data = data[k]
 
         data[keys[-1]] = value
+        self._version += 1
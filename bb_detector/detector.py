@@ -13,9 +13,29 @@ Config structure (games_config style):
 - games.{current_game}.tesseract_config: str
 - current_game: str (e.g. "Bloodborne", "Dark Souls 3")
 """
+import os
+import queue
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Tesseract's OpenMP threading is a net loss on small single-line images
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
 import cv2
 import numpy as np
-from typing import Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: fall back to per-keyword substring checks
+    ahocorasick = None
+
+try:
+    import tesserocr
+except ImportError:  # Optional: in-process OCR, otherwise pytesseract subprocess
+    tesserocr = None
 
 from .config import Config
 
@@ -39,12 +59,43 @@ class DeathDetector:
         "YOUDLED", "YOUOIED", "Y0UD13D",
     ]
 
+    # Strips everything str.isalnum() rejects ([\W_] is exactly that set)
+    _NON_ALNUM = re.compile(r'[\W_]+')
+
+    # Common OCR error corrections: 0 -> O, 1 -> I, 3 -> E, 5 -> S, 7 -> T
+    _FUZZY_TBL = str.maketrans('01357', 'OIEST')
+
+    # Share of text ("ink") pixels a thresholded image needs to be worth OCR'ing.
+    # Blank gameplay frames fall below the minimum; near 50/50 Otsu splits are
+    # noise or texture rather than text.
+    MIN_INK_FRACTION = 0.005
+    MAX_INK_FRACTION = 0.4
+
+    # ocr_max_height never shrinks a frame below this scale: it is sized for
+    # detection regions, and a full-screen frame squeezed to 96 px leaves the
+    # death text only a few pixels tall
+    OCR_MIN_SCALE = 0.5
+
+    # Persistent tesserocr APIs (detection thread + calibration UI)
+    OCR_WORKERS = 2
+
+    # OCR outcomes remembered per distinct frame (LRU)
+    OCR_CACHE_SIZE = 256
+
     def __init__(self, config: Config):
         self.config = config
 
         # Load settings from config (games_config style)
         self._load_settings()
 
+        # OCR engines, bound once by _check_ocr() so the hot path skips imports.
+        # With tesserocr, one persistent API per OCR worker (the API is not
+        # thread-safe); otherwise pytesseract spawns tesseract per call.
+        self._tess_apis: Optional[queue.SimpleQueue] = None
+        self._tess_settings: tuple = ()
+        self._pytesseract = None
+        self._pil_image = None
+
         # OCR availability flag
         self._ocr_available = self._check_ocr()
 
@@ -52,21 +103,40 @@ class DeathDetector:
         self.last_method: Optional[str] = None
         self.last_confidence: float = 0.0
 
+        # Preprocessing buffers, reused across ticks (sized on first frame).
+        # Per thread: check_death runs on the detection worker and, for
+        # calibration, on the UI thread.
+        self._buffers = threading.local()
+
+        # (shape, dtype, blake2b digest) -> (detected, text). Recurring frames
+        # (menus, HUD states alternating) reuse the OCR outcome; the streak
+        # logic still runs.
+        self._ocr_cache: OrderedDict[tuple, Tuple[bool, str]] = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
+
     def _load_settings(self):
         """Load settings from config (games_config style)."""
+        settings = self.config.settings
+
         # Streak-based confirmation
         self.consecutive_hits = 0
-        self.required_streak = self.config.get('settings.consecutive_hits', 2)
+        self.required_streak = settings.get('consecutive_hits', 2)
 
         # Fuzzy OCR matching (O→0, I→1, etc.)
-        self.fuzzy_matching = self.config.get('settings.fuzzy_ocr_matching', True)
+        self.fuzzy_matching = settings.get('fuzzy_ocr_matching', True)
+
+        # Taller regions are downscaled before OCR (tesseract cost scales with area),
+        # very short ones upscaled (tesseract misreads glyphs only a few px tall)
+        self.ocr_max_height = settings.get('ocr_max_height', 96)
+        self.ocr_min_height = settings.get('ocr_min_height', 48)
 
         # Get current game settings
-        current_game = self.config.get('current_game', 'Bloodborne')
-        game_config = self.config.get(f'games.{current_game}', {})
+        game_config = self.config.get_game_config()
 
         # Keywords from current game (or defaults)
         self.keywords = game_config.get('keywords', self.DEFAULT_KEYWORDS)
+        self._kw_normalized = [kw.replace(' ', '').upper() for kw in self.keywords]
+        self._kw_automaton = self._build_automaton(self._kw_normalized)
 
         # Tesseract config from current game
         self.tesseract_config = game_config.get(
@@ -74,12 +144,90 @@ class DeathDetector:
             '--oem 3 --psm 6'
         )
 
+    @staticmethod
+    def _build_automaton(keywords: List[str]):
+        """Compile keywords into one Aho-Corasick automaton (None if unavailable)."""
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            if kw:
+                automaton.add_word(kw, kw)
+
+        if len(automaton) == 0:
+            return None
+
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _parse_tesseract_config(config: str) -> Tuple[int, int, Dict[str, str]]:
+        """Split a tesseract CLI config string into (psm, oem, -c variables)."""
+        psm, oem = 3, 3  # tesseract CLI defaults
+        variables: Dict[str, str] = {}
+
+        args = config.split()
+        for flag, value in zip(args, args[1:]):
+            if flag == '--psm':
+                psm = int(value)
+            elif flag == '--oem':
+                oem = int(value)
+            elif flag == '-c' and '=' in value:
+                name, _, val = value.partition('=')
+                variables[name] = val
+
+        return psm, oem, variables
+
+    def _tess_settings_for_config(self) -> tuple:
+        """Hashable (psm, oem, tessdata path, variables) for the current game config."""
+        psm, oem, variables = self._parse_tesseract_config(self.tesseract_config)
+        return psm, oem, os.environ.get('TESSDATA_PREFIX'), tuple(variables.items())
+
+    @staticmethod
+    def _new_tess_api(settings: tuple):
+        psm, oem, tessdata, variables = settings
+        kwargs = {'lang': 'eng', 'psm': psm, 'oem': oem}
+        if tessdata:
+            kwargs['path'] = tessdata
+
+        api = tesserocr.PyTessBaseAPI(**kwargs)
+        for name, value in variables:
+            api.SetVariable(name, value)
+        return api
+
+    def _create_tess_apis(self) -> Optional[queue.SimpleQueue]:
+        """
+        Initialise persistent tesserocr APIs for the current game config.
+
+        The pool holds (settings, api) pairs; an API whose settings are stale
+        after reload() is ended and replaced when it is next checked out.
+        """
+        if tesserocr is None:
+            return None
+
+        try:
+            settings = self._tess_settings = self._tess_settings_for_config()
+            apis = queue.SimpleQueue()
+            for _ in range(self.OCR_WORKERS):
+                apis.put((settings, self._new_tess_api(settings)))
+            return apis
+        except Exception:
+            return None
+
     def _check_ocr(self) -> bool:
-        """Check if pytesseract is available."""
+        """Check if an OCR engine is available (tesserocr, then pytesseract)."""
+        self._tess_apis = self._create_tess_apis()
+        if self._tess_apis is not None:
+            return True
+
         try:
             import pytesseract
+            from PIL import Image
             # Try to get version to verify tesseract is installed
             pytesseract.get_tesseract_version()
+            self._pytesseract = pytesseract
+            self._pil_image = Image
             return True
         except Exception:
             return False
@@ -90,12 +238,21 @@ class DeathDetector:
         self._load_settings()
         self.consecutive_hits = 0
 
+        # Keywords or tesseract settings may have changed
+        with self._ocr_cache_lock:
+            self._ocr_cache.clear()
+
+        # Game switch may change psm/whitelist: pooled APIs are re-created on
+        # next use (one may be mid-OCR on another thread right now)
+        if self._tess_apis is not None:
+            self._tess_settings = self._tess_settings_for_config()
+
     def check_death(self, frame: np.ndarray) -> Tuple[bool, float]:
         """
         Check for death using OCR detection with streak confirmation.
 
         Args:
-            frame: BGR/RGB image frame to analyze
+            frame: RGB image or single-channel grayscale frame to analyze
 
         Returns:
             Tuple of (is_death_confirmed, confidence)
@@ -106,7 +263,7 @@ class DeathDetector:
 
         # OCR detection only
         if self._ocr_available:
-            ocr_detected, ocr_text = self._ocr_detect(frame)
+            ocr_detected, ocr_text = self._cached_ocr_detect(frame)
             if ocr_detected:
                 return self._confirm_detection(True, 1.0, f"ocr:{ocr_text}")
 
@@ -142,6 +299,113 @@ class DeathDetector:
 
         return confirmed, confidence
 
+    def _ocr_size(self, size: Tuple[int, int]) -> Tuple[int, int]:
+        """Return (height, width) of the image fed to tesseract."""
+        h, w = size
+        if self.ocr_max_height and h > self.ocr_max_height:
+            target = max(self.ocr_max_height, round(h * self.OCR_MIN_SCALE))
+        elif self.ocr_min_height and h < self.ocr_min_height:
+            target = self.ocr_min_height
+        else:
+            return size
+        return target, max(1, round(w * target / h))
+
+    @staticmethod
+    def _interpolation(src: Tuple[int, int], dst: Tuple[int, int]) -> int:
+        """INTER_AREA for shrinking, INTER_CUBIC for enlarging."""
+        return cv2.INTER_AREA if dst[0] < src[0] else cv2.INTER_CUBIC
+
+    def _ensure_buffers(self, shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return this thread's (gray, gray_small, thresh) buffers,
+        (re)allocated only when the frame size changes.
+        """
+        buf = self._buffers
+        size = shape[:2]
+        gray = getattr(buf, 'gray', None)
+        if gray is None or gray.shape != size:
+            gray = buf.gray = np.empty(size, dtype=np.uint8)
+
+        ocr_size = self._ocr_size(size)
+        thresh = getattr(buf, 'thresh', None)
+        if thresh is None or thresh.shape != ocr_size:
+            buf.gray_small = np.empty(ocr_size, dtype=np.uint8)
+            thresh = buf.thresh = np.empty(ocr_size, dtype=np.uint8)
+
+        return gray, buf.gray_small, thresh
+
+    def _binarize(self, gray: np.ndarray, dst: Optional[np.ndarray] = None) -> Tuple[np.ndarray, float]:
+        """
+        Otsu-threshold a grayscale image to dark text on a light background.
+
+        Otsu picks the threshold from the histogram, so light-on-dark and
+        dark-on-light text both come out of a single pass; the minority class
+        is taken as text and made black, which is what tesseract expects.
+
+        Returns:
+            Tuple of (binary image, ink fraction)
+        """
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=dst)
+        size = binary.size
+        white = cv2.countNonZero(binary)
+        if white < size - white:
+            cv2.bitwise_not(binary, dst=binary)
+            white = size - white
+        return binary, (size - white) / size
+
+    def _to_pil(self, img: np.ndarray):
+        """Wrap a contiguous grayscale buffer as a PIL image without copying."""
+        if not img.flags['C_CONTIGUOUS']:
+            img = np.ascontiguousarray(img)
+        h, w = img.shape[:2]
+        return self._pil_image.frombuffer('L', (w, h), img, 'raw', 'L', 0, 1)
+
+    def _ocr_image(self, img: np.ndarray) -> str:
+        """Run OCR on a single-channel uint8 image."""
+        apis = self._tess_apis
+        if apis is not None:
+            settings, api = apis.get()
+            try:
+                current = self._tess_settings
+                if settings != current:
+                    new_api = self._new_tess_api(current)
+                    api.End()
+                    settings, api = current, new_api
+
+                h, w = img.shape[:2]
+                api.SetImageBytes(img.tobytes(), w, h, 1, w)
+                return api.GetUTF8Text()
+            finally:
+                apis.put((settings, api))
+
+        return self._pytesseract.image_to_string(
+            self._to_pil(img), config=self.tesseract_config
+        )
+
+    def _cached_ocr_detect(self, frame: np.ndarray) -> Tuple[bool, str]:
+        """_ocr_detect() with an LRU cache keyed by the frame's content."""
+        if not frame.flags['C_CONTIGUOUS']:
+            return self._ocr_detect(frame)
+
+        # 128-bit digest: a collision would replay another frame's result
+        key = (frame.shape, frame.dtype.str, hashlib.blake2b(frame, digest_size=16).digest())
+        cache = self._ocr_cache
+        with self._ocr_cache_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+                return result
+
+        result = self._ocr_detect(frame)
+        if result[1].startswith('error:'):
+            return result
+
+        with self._ocr_cache_lock:
+            cache[key] = result
+            if len(cache) > self.OCR_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
     def _ocr_detect(self, frame: np.ndarray) -> Tuple[bool, str]:
         """
         Perform OCR detection on the frame.
@@ -152,37 +416,35 @@ class DeathDetector:
             Tuple of (detected, recognized_text)
         """
         try:
-            import pytesseract
-            from PIL import Image
+            gray_buf, small_buf, thresh_buf = self._ensure_buffers(frame.shape)
 
             # Preprocess for better OCR
             if len(frame.shape) == 3:
-                gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+                gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY, dst=gray_buf)
             else:
                 gray = frame
 
-            # Apply threshold to get high-contrast text
-            _, thresh = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY)
-
-            # Also try inverted (white text on dark background)
-            _, thresh_inv = cv2.threshold(gray, 50, 255, cv2.THRESH_BINARY_INV)
+            # Rescale to OCR height; only the rescaled image is thresholded
+            if gray.shape != thresh_buf.shape:
+                h, w = thresh_buf.shape
+                gray = cv2.resize(
+                    gray, (w, h), dst=small_buf,
+                    interpolation=self._interpolation(gray.shape, thresh_buf.shape)
+                )
 
-            # Use tesseract config from current game
-            ocr_config = self.tesseract_config
+            # Single Otsu pass covers both bright and dark text
+            thresh, ink = self._binarize(gray, dst=thresh_buf)
 
-            all_text = []
+            # Only OCR images that can plausibly contain text
+            if not self.MIN_INK_FRACTION <= ink <= self.MAX_INK_FRACTION:
+                return False, ''
 
-            # Try both thresholded images
-            for img in [thresh, thresh_inv]:
-                pil_img = Image.fromarray(img)
-                text = pytesseract.image_to_string(pil_img, config=ocr_config)
-                all_text.append(text.strip())
+            text = self._ocr_image(thresh).strip()
+            if self._contains_keyword(text):
+                return True, text[:50]  # Return first 50 chars
 
-                if self._contains_keyword(text):
-                    return True, text.strip()[:50]  # Return first 50 chars
-
-            # Return combined text for debugging even if no match
-            return False, ' | '.join(filter(None, all_text))[:50]
+            # Return text for debugging even if no match
+            return False, text[:50]
 
         except Exception as e:
             return False, f"error:{str(e)[:30]}"
@@ -196,33 +458,35 @@ class DeathDetector:
 
         Uses keywords from games.{current_game}.keywords
         """
-        # Normalize: uppercase, remove spaces and non-alphanumeric
-        normalized = ''.join(c for c in text.upper() if c.isalnum())
+        normalized = self._normalize(text)
 
         # Apply fuzzy OCR correction if enabled
         if self.fuzzy_matching:
-            # Common OCR error corrections (as per FUZZY_MATCHING_GUIDE.md)
-            corrected = (
-                normalized
-                .replace('0', 'O')
-                .replace('1', 'I')
-                .replace('3', 'E')
-                .replace('5', 'S')
-                .replace('7', 'T')
-            )
+            corrected = normalized.translate(self._FUZZY_TBL)
         else:
             corrected = normalized
 
-        # Use keywords from current game config
-        for keyword in self.keywords:
-            kw_normalized = keyword.replace(' ', '').upper()
+        # Single pass over each text regardless of keyword count
+        if self._kw_automaton is not None:
+            automaton = self._kw_automaton
+            if next(automaton.iter(normalized), None) is not None:
+                return True
+            return (
+                corrected != normalized
+                and next(automaton.iter(corrected), None) is not None
+            )
 
-            # Check both original and corrected text
-            if kw_normalized in normalized or kw_normalized in corrected:
+        # Check both original and corrected text
+        for kw in self._kw_normalized:
+            if kw in normalized or kw in corrected:
                 return True
 
         return False
 
+    def _normalize(self, text: str) -> str:
+        """Uppercase and remove spaces and non-alphanumeric characters."""
+        return self._NON_ALNUM.sub('', text.upper())
+
     def check_death_region(
         self,
         frame: np.ndarray,
@@ -266,23 +530,26 @@ class DeathDetector:
         # OCR (if available)
         if self._ocr_available:
             try:
-                import pytesseract
-                from PIL import Image
-
                 if len(frame.shape) == 3:
                     gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
                 else:
                     gray = frame
 
-                _, thresh = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY)
-                pil_img = Image.fromarray(thresh)
-                text = pytesseract.image_to_string(pil_img, config=self.tesseract_config)
+                ocr_size = self._ocr_size(gray.shape[:2])
+                if ocr_size != gray.shape[:2]:
+                    gray = cv2.resize(
+                        gray, (ocr_size[1], ocr_size[0]),
+                        interpolation=self._interpolation(gray.shape, ocr_size)
+                    )
+
+                thresh, _ = self._binarize(gray)
+                text = self._ocr_image(thresh)
 
                 result['ocr_text'] = text.strip()
                 result['ocr_match'] = self._contains_keyword(text)
 
                 # Find which keywords matched
-                normalized = ''.join(c for c in text.upper() if c.isalnum())
+                normalized = self._normalize(text)
                 for kw in self.keywords:
                     if kw.replace(' ', '') in normalized:
                         result['keywords_found'].append(kw)
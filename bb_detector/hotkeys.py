@@ -1,14 +1,38 @@
 # bb_detector/hotkeys.py
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, Set
 from pynput import keyboard
 
+# Modifier/special keys folded to the names used in hotkey strings
+SPECIAL_KEYS = {
+    keyboard.Key.ctrl_l: 'ctrl',
+    keyboard.Key.ctrl_r: 'ctrl',
+    keyboard.Key.cmd: 'ctrl',
+    keyboard.Key.cmd_l: 'ctrl',
+    keyboard.Key.cmd_r: 'ctrl',
+    keyboard.Key.shift_l: 'shift',
+    keyboard.Key.shift_r: 'shift',
+    keyboard.Key.alt_l: 'alt',
+    keyboard.Key.alt_r: 'alt',
+    keyboard.Key.alt_gr: 'alt',
+    keyboard.Key.space: 'space',
+    keyboard.Key.enter: 'enter',
+    keyboard.Key.esc: 'esc',
+    keyboard.Key.tab: 'tab',
+    keyboard.Key.backspace: 'backspace',
+}
+
 
 class GlobalHotkeys:
     def __init__(self):
         self.hotkeys: Dict[frozenset, Callable] = {}
         self.current_keys: Set[str] = set()
+        # Snapshot of current_keys, rebuilt only when the held set changes
+        self._current_frozen: frozenset = frozenset()
         self.listener: keyboard.Listener | None = None
+        # One long-lived worker runs callbacks in order (created in start())
+        self._executor: ThreadPoolExecutor | None = None
         self._lock = threading.Lock()
 
     def register(self, keys: str, callback: Callable):
@@ -29,6 +53,7 @@ class GlobalHotkeys:
         if self.listener is not None:
             return
 
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='hotkey')
         self.listener = keyboard.Listener(
             on_press=self._on_press,
             on_release=self._on_release
@@ -39,28 +64,15 @@ class GlobalHotkeys:
         if self.listener:
             self.listener.stop()
             self.listener = None
+        # Under the lock so _on_press never submits to a shut-down executor
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
 
     def _normalize_key(self, key) -> str | None:
-        special_map = {
-            keyboard.Key.ctrl_l: 'ctrl',
-            keyboard.Key.ctrl_r: 'ctrl',
-            keyboard.Key.cmd: 'ctrl',
-            keyboard.Key.cmd_l: 'ctrl',
-            keyboard.Key.cmd_r: 'ctrl',
-            keyboard.Key.shift_l: 'shift',
-            keyboard.Key.shift_r: 'shift',
-            keyboard.Key.alt_l: 'alt',
-            keyboard.Key.alt_r: 'alt',
-            keyboard.Key.alt_gr: 'alt',
-            keyboard.Key.space: 'space',
-            keyboard.Key.enter: 'enter',
-            keyboard.Key.esc: 'esc',
-            keyboard.Key.tab: 'tab',
-            keyboard.Key.backspace: 'backspace',
-        }
-
-        if key in special_map:
-            return special_map[key]
+        if key in SPECIAL_KEYS:
+            return SPECIAL_KEYS[key]
 
         if hasattr(key, 'char') and key.char:
             return key.char.lower()
@@ -76,20 +88,26 @@ class GlobalHotkeys:
             return
 
         with self._lock:
-            self.current_keys.add(key_name)
-            frozen = frozenset(self.current_keys)
-
-            if frozen in self.hotkeys:
-                callback = self.hotkeys[frozen]
-                def safe_callback():
-                    try:
-                        callback()
-                    except Exception:
-                        pass
-                threading.Thread(target=safe_callback, daemon=True).start()
+            # Auto-repeat re-sends held keys; only a new key changes the set
+            if key_name not in self.current_keys:
+                self.current_keys.add(key_name)
+                self._current_frozen = frozenset(self.current_keys)
+
+            callback = self.hotkeys.get(self._current_frozen)
+            if callback is not None and self._executor is not None:
+                self._executor.submit(self._safe_call, callback)
+
+    @staticmethod
+    def _safe_call(callback: Callable):
+        try:
+            callback()
+        except Exception:
+            pass
 
     def _on_release(self, key):
         key_name = self._normalize_key(key)
         if key_name:
             with self._lock:
-                self.current_keys.discard(key_name)
+                if key_name in self.current_keys:
+                    self.current_keys.discard(key_name)
+                    self._current_frozen = frozenset(self.current_keys)
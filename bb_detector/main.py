@@ -1,11 +1,24 @@
 # bb_detector/main.py
 """BB Death Detector - Main application entry point."""
 import asyncio
+import logging
+import os
+import queue
 import signal
+import sys
+import threading
 import time
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable
+
+import cv2
+import numpy as np
 
 from .config import Config
-from .state import StateManager
+from .state import StateManager, FLAG_DETECTION, FLAG_CONNECTED
 from .platform_utils import get_platform, check_macos_permissions, open_macos_permissions, open_macos_accessibility_settings
 from .capture import ScreenCapture
 from .detector import DeathDetector
@@ -15,6 +28,68 @@ from .window_utils import find_window_by_name, capture_window_region
 from .ui.app import App
 from .tesseract_utils import configure_pytesseract
 
+# Named explicitly: __name__ is '__main__' when run with -m
+log = logging.getLogger('bb_detector')
+
+
+def _setup_logging() -> QueueListener:
+    """Route package logs through a queue so stdout writes happen off-thread."""
+    log_queue = queue.SimpleQueue()
+    log.addHandler(QueueHandler(log_queue))
+    # BB_DETECTOR_DEBUG=1 turns on the per-second detection trace
+    log.setLevel(logging.DEBUG if os.environ.get('BB_DETECTOR_DEBUG') else logging.INFO)
+    log.propagate = False
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, stream)
+    listener.start()
+    return listener
+
+
+# Detection needs both flags set
+_DETECTION_READY = FLAG_DETECTION | FLAG_CONNECTED
+
+# Side of the thumbnail used to tell whether the detection frame changed
+_THUMB_SIZE = 32
+
+
+@dataclass(frozen=True, slots=True)
+class RegionSpec:
+    """Detection region settings, read from config once per change."""
+    window_name: str = ''
+    x_pct: float = 0
+    y_pct: float = 0
+    w_pct: float = 0
+    h_pct: float = 0
+    absolute: tuple[int, int, int, int] | None = None  # window-mode fallback
+    legacy: tuple[int, int, int, int] | None = None  # plain absolute region
+
+    @classmethod
+    def from_config(cls, config: Config) -> 'RegionSpec':
+        region = config.view('detection.region')
+        absolute = config.view('detection.region.absolute')
+        return cls(
+            window_name=region.get('window_name', ''),
+            x_pct=region.get('x_percent', 0),
+            y_pct=region.get('y_percent', 0),
+            w_pct=region.get('w_percent', 0),
+            h_pct=region.get('h_percent', 0),
+            absolute=_rect(absolute.get('x', 0), absolute.get('y', 0),
+                           absolute.get('width', 0), absolute.get('height', 0)),
+            legacy=_rect(region.get('x', 0), region.get('y', 0),
+                         region.get('width', 0), region.get('height', 0)),
+        )
+
+    @property
+    def has_window_region(self) -> bool:
+        return bool(self.window_name) and self.w_pct > 0 and self.h_pct > 0
+
+
+def _rect(x: int, y: int, w: int, h: int) -> tuple[int, int, int, int] | None:
+    """(x, y, w, h), or None for an empty rectangle."""
+    return (x, y, w, h) if w > 0 and h > 0 else None
+
 
 class BBDetectorApp:
     """Main application controller."""
@@ -33,11 +108,47 @@ class BBDetectorApp:
 
         # Async
         self.loop: asyncio.AbstractEventLoop | None = None
-        self._last_death_time = 0
+        self._last_death_time = float('-inf')  # time.monotonic() of last death
+
+        # WebSocket calls posted from UI/hotkey threads, drained on the loop.
+        # Bursts of posts share a single cross-thread wakeup.
+        self._submit_q: deque = deque()
+        self._drain_pending = False
+        self._ws_tasks: set[asyncio.Task] = set()
+
+        # HTTP session for profile API calls (created on first use)
+        self._http = None
+
+        # Hotkey actions queued by the listener, run by _main_loop on the UI
+        # thread (deque.append/popleft are atomic)
+        self._hotkey_ring: deque = deque(maxlen=64)
+
+        # Set by _stop_loop when a tick callback fails
+        self._loop_error: BaseException | None = None
+
+        # Detection runs on a dedicated thread; the detect tick wakes it by
+        # putting a token, and a full queue means a run is already pending
+        self._detect_q: queue.Queue = queue.Queue(maxsize=1)
+        self._detect_thread: threading.Thread | None = None
+
+        # Sequence number of the last streamed frame passed to the detector
+        self._last_frame_seq = 0
+        # Thumbnail of the last analyzed frame (static screens skip OCR)
+        self._prev_thumb = None
+        # Full-screen buffer for the live calibration preview
+        self._preview_buf: np.ndarray | None = None
 
     def run(self):
         """Main entry point."""
-        print("BB Death Detector starting...", flush=True)
+        listener = _setup_logging()
+        try:
+            self._run()
+        finally:
+            # Flushes anything still queued
+            listener.stop()
+
+    def _run(self):
+        log.info("BB Death Detector starting...")
 
         # Configure Tesseract OCR (bundled or system)
         configure_pytesseract()
@@ -46,9 +157,9 @@ class BBDetectorApp:
         if get_platform() == 'macos':
             perms = check_macos_permissions()
             if not perms['screen']:
-                print("Нужно разрешение на Запись экрана!", flush=True)
-                print("Добавь Terminal (или VS Code/iTerm) в список и включи.", flush=True)
-                print("Путь: Системные настройки > Конфиденциальность и безопасность > Запись экрана", flush=True)
+                log.warning("Нужно разрешение на Запись экрана!")
+                log.warning("Добавь Terminal (или VS Code/iTerm) в список и включи.")
+                log.warning("Путь: Системные настройки > Конфиденциальность и безопасность > Запись экрана")
                 open_macos_permissions()
                 return
 
@@ -64,10 +175,12 @@ class BBDetectorApp:
 
     def _init_components(self):
         """Initialize all components."""
-        monitor = self.config.get('detection.monitor', 0)
-        fps = self.config.get('detection.fps', 10)
+        self._load_detection_settings()
 
-        self.capture = ScreenCapture(monitor=monitor, fps=fps)
+        self.capture = ScreenCapture(
+            monitor=self.config.get('detection.monitor', 0), fps=self._detection_fps
+        )
+        self._set_region(RegionSpec.from_config(self.config))
         self.detector = DeathDetector(self.config)
 
         profile = self.config.get('profile.name')
@@ -80,6 +193,8 @@ class BBDetectorApp:
             on_connect=self._on_ws_connect,
             on_disconnect=self._on_ws_disconnect
         )
+        # The client is reused across profile switches, so bind once
+        self._bind_ws_methods()
 
         self.hotkeys = GlobalHotkeys()
 
@@ -108,30 +223,44 @@ class BBDetectorApp:
             on_delete_milestone=self._on_delete_milestone,
             on_add_stats=self._on_add_stats,
             on_delete_stats=self._on_delete_stats,
+            on_settings_saved=self._on_settings_saved,
         )
 
+    def _load_detection_settings(self):
+        """Cache per-tick detection settings (re-read when Setup saves)."""
+        detection = self.config.view('detection')
+        self._detection_fps = detection.get('fps', 10)
+        self._detection_interval = 1.0 / self._detection_fps
+        self._death_cooldown = detection.get('death_cooldown', 5.0)
+        self._skip_unchanged = detection.get('skip_unchanged', True)
+        # Mean per-pixel change (0-255) below which a frame counts as unchanged
+        self._diff_threshold = detection.get('diff_threshold', 2.0)
+
     def _register_hotkeys(self):
         """Register global hotkeys."""
-        hotkeys_cfg = self.config.get('hotkeys', {})
-
-        self.hotkeys.register(
-            hotkeys_cfg.get('manual_death', 'ctrl+shift+d'),
-            self._on_manual_death
-        )
-        self.hotkeys.register(
-            hotkeys_cfg.get('toggle_boss', 'ctrl+shift+b'),
-            self._on_toggle_boss
-        )
-        self.hotkeys.register(
-            hotkeys_cfg.get('toggle_detection', 'ctrl+shift+p'),
-            self._on_toggle_detection
+        hotkeys_cfg = self.config.view('hotkeys')
+        push = self._hotkey_ring.append
+
+        bindings = (
+            (hotkeys_cfg.get('manual_death', 'ctrl+shift+d'), self._on_manual_death),
+            (hotkeys_cfg.get('toggle_boss', 'ctrl+shift+b'), self._on_toggle_boss),
+            (hotkeys_cfg.get('toggle_detection', 'ctrl+shift+p'), self._on_toggle_detection),
+            (hotkeys_cfg.get('show_overlay', 'ctrl+shift+o'), self._on_toggle_mode),
+            # F9 for region selection
+            ('f9', self._on_f9_hotkey),
         )
-        self.hotkeys.register(
-            hotkeys_cfg.get('show_overlay', 'ctrl+shift+o'),
-            self._on_toggle_mode
-        )
-        # F9 for region selection
-        self.hotkeys.register('f9', self._on_f9_hotkey)
+        for combo, action in bindings:
+            self.hotkeys.register(combo, partial(push, action))
+
+    def _drain_hotkeys(self):
+        """Run queued hotkey actions (called from _main_loop)."""
+        ring = self._hotkey_ring
+        while ring:
+            action = ring.popleft()
+            try:
+                action()
+            except Exception as e:
+                log.warning(f"[Hotkeys] Action error: {e}")
 
     def _start(self):
         """Start all services and main loop."""
@@ -145,15 +274,20 @@ class BBDetectorApp:
         # Register hotkeys (but don't start listener yet)
         self._register_hotkeys()
 
-        # Start capture
+        # Start capture; detection frames are grabbed on the capture thread
         self.capture.start()
+        self.capture.start_stream(self._grab_detection_frame)
+        self._detect_thread = threading.Thread(
+            target=self._detect_worker, name='detection', daemon=True
+        )
+        self._detect_thread.start()
 
         # Show profile dialog if no profile configured
         if not self.config.get('profile.name'):
             self.app.show_profile_dialog()
 
         # Create async loop BEFORE starting hotkeys (avoids thread conflict on macOS)
-        self.loop = asyncio.new_event_loop()
+        self.loop = self._new_event_loop()
         asyncio.set_event_loop(self.loop)
 
         # Start hotkeys AFTER asyncio loop is set up
@@ -161,10 +295,10 @@ class BBDetectorApp:
         if get_platform() == 'macos':
             perms = check_macos_permissions()
             if not perms['accessibility']:
-                print("[!] Нет разрешения на Универсальный доступ!", flush=True)
-                print("    Открываю настройки...", flush=True)
-                print("    Добавь Terminal в список и включи его.", flush=True)
-                print("    Путь: Системные настройки > Конфиденциальность и безопасность > Универсальный доступ", flush=True)
+                log.warning("[!] Нет разрешения на Универсальный доступ!")
+                log.warning("    Открываю настройки...")
+                log.warning("    Добавь Terminal в список и включи его.")
+                log.warning("    Путь: Системные настройки > Конфиденциальность и безопасность > Универсальный доступ")
                 open_macos_accessibility_settings()
 
         self.hotkeys.start()
@@ -176,6 +310,15 @@ class BBDetectorApp:
         finally:
             self._shutdown()
 
+    @staticmethod
+    def _new_event_loop() -> asyncio.AbstractEventLoop:
+        """Create the event loop, using uvloop where available (not on Windows)."""
+        try:
+            import uvloop
+            return uvloop.new_event_loop()
+        except ImportError:
+            return asyncio.new_event_loop()
+
     def _get_detection_region(self) -> tuple[int, int, int, int] | None:
         """
         Get detection region in absolute screen coordinates.
@@ -187,181 +330,308 @@ class BBDetectorApp:
         Returns:
             Tuple of (x, y, width, height) or None if no valid region.
         """
-        # Check for window-relative region first
-        window_name = self.config.get('detection.region.window_name', '')
+        spec = self._region
 
-        if window_name:
+        if spec.window_name:
             # Window-relative mode
-            window = find_window_by_name(window_name)
-            if window:
+            window = find_window_by_name(spec.window_name)
+            if window and spec.has_window_region:
                 wb = window['bounds']
-                x_pct = self.config.get('detection.region.x_percent', 0)
-                y_pct = self.config.get('detection.region.y_percent', 0)
-                w_pct = self.config.get('detection.region.w_percent', 0)
-                h_pct = self.config.get('detection.region.h_percent', 0)
-
-                if w_pct > 0 and h_pct > 0:
-                    x = int(wb['x'] + x_pct * wb['width'])
-                    y = int(wb['y'] + y_pct * wb['height'])
-                    w = int(w_pct * wb['width'])
-                    h = int(h_pct * wb['height'])
-                    return (x, y, w, h)
+                x = int(wb['x'] + spec.x_pct * wb['width'])
+                y = int(wb['y'] + spec.y_pct * wb['height'])
+                w = int(spec.w_pct * wb['width'])
+                h = int(spec.h_pct * wb['height'])
+                return (x, y, w, h)
 
             # Window not found, try absolute fallback
-            abs_x = self.config.get('detection.region.absolute.x', 0)
-            abs_y = self.config.get('detection.region.absolute.y', 0)
-            abs_w = self.config.get('detection.region.absolute.width', 0)
-            abs_h = self.config.get('detection.region.absolute.height', 0)
-
-            if abs_w > 0 and abs_h > 0:
-                return (abs_x, abs_y, abs_w, abs_h)
+            if spec.absolute:
+                return spec.absolute
 
         # Legacy absolute region (backwards compatibility)
-        region_x = self.config.get('detection.region.x', 0)
-        region_y = self.config.get('detection.region.y', 0)
-        region_w = self.config.get('detection.region.width', 0)
-        region_h = self.config.get('detection.region.height', 0)
-
-        if region_w > 0 and region_h > 0:
-            return (region_x, region_y, region_w, region_h)
-
-        return None
+        return spec.legacy
 
     async def _main_loop(self):
-        """Main application loop."""
+        """Main application loop.
+
+        UI rendering and detection dispatch are two periodic callbacks driven
+        by loop.call_at; the coroutine itself just waits until shutdown.
+        """
         # Start WebSocket if profile configured
         if self.config.get('profile.name'):
             ws_task = asyncio.create_task(self.ws.connect())
         else:
             ws_task = None
 
-        # Detection runs at lower FPS, UI renders every frame
-        detection_fps = self.config.get('detection.fps', 10)
-        detection_interval = 1.0 / detection_fps
-        cooldown = self.config.get('detection.death_cooldown', 5.0)
-
-        # UI renders at 60 FPS for smooth experience
-        ui_interval = 1.0 / 60.0
-        last_detection_time = 0
-
-        # Detection runs in background thread to not block UI
-        self._detection_result = None
-        self._detection_running = False
-
-        while self.running and self.app.is_running():
-            loop_start = time.time()
-
-            # Check detection result from background thread
-            if self._detection_result is not None:
-                is_dead, confidence = self._detection_result
-                self._detection_result = None
-
-                # Debug: show detection status periodically
-                if hasattr(self, '_debug_counter'):
-                    self._debug_counter += 1
-                else:
-                    self._debug_counter = 0
-
-                if self._debug_counter % 10 == 0:  # Every second
-                    method = self.detector.last_method or "none"
-                    print(f"[Debug] Detection: match={is_dead}, conf={confidence:.2f}, method={method}", flush=True)
-
-                if is_dead:
-                    now = time.time()
-                    if now - self._last_death_time > cooldown:
-                        self._last_death_time = now
-                        await self._handle_death()
-
-            # Start detection in background thread (if not already running)
-            if (time.time() - last_detection_time >= detection_interval and
-                not self._detection_running and
-                self.state.detection_enabled and self.state.connected):
-
-                last_detection_time = time.time()
-                self._detection_running = True
-
-                # Run detection in thread pool to not block UI
-                asyncio.get_event_loop().run_in_executor(
-                    None,  # Default thread pool
-                    self._run_detection_sync
-                )
-
-            # Render UI every frame (60 FPS) - never blocked by detection
+        # UI redraws at ui.fps, detection is dispatched at detection.fps
+        self._ui_interval = 1.0 / self.config.get('ui.fps', 30)
+        self._stopped = asyncio.Event()
+
+        # Absolute deadlines: a late wakeup doesn't push back every later tick
+        now = self.loop.time()
+        self._ui_deadline = now
+        self._detect_deadline = now
+        self._ui_handle = self.loop.call_soon(self._tick_ui)
+        self._detect_handle = self.loop.call_soon(self._tick_detect)
+
+        try:
+            await self._stopped.wait()
+        finally:
+            self._ui_handle.cancel()
+            self._detect_handle.cancel()
+            if ws_task:
+                ws_task.cancel()
+
+        if self._loop_error is not None:
+            raise self._loop_error
+
+    def _stop_loop(self, error: BaseException | None = None):
+        """End _main_loop (optionally re-raising error from it)."""
+        self.running = False
+        # The other tick may stop the loop again in the same batch; keep the first error
+        if error is not None and self._loop_error is None:
+            self._loop_error = error
+        self._stopped.set()
+
+    def _next_deadline(self, deadline: float, interval: float) -> float:
+        """Advance a tick deadline; resync instead of bursting after a stall."""
+        deadline += interval
+        now = self.loop.time()
+        return deadline if deadline > now else now
+
+    def _tick_ui(self):
+        """Periodic UI tick: run queued hotkey actions and render a frame."""
+        if not self.running:
+            self._stop_loop()
+            return
+
+        try:
+            if self._hotkey_ring:
+                self._drain_hotkeys()
+
             self.app.render()
+            # Window close is only observed by render()
+            if not self.app.is_running():
+                self._stop_loop()
+                return
+        except Exception as e:
+            self._stop_loop(e)
+            return
+
+        self._ui_deadline = self._next_deadline(self._ui_deadline, self._ui_interval)
+        self._ui_handle = self.loop.call_at(self._ui_deadline, self._tick_ui)
+
+    def _tick_detect(self):
+        """Periodic detection tick: start the next run if none is in flight."""
+        if not self.running:
+            self._stop_loop()
+            return
+
+        try:
+            # Wake the detection thread (unless a run is already pending)
+            if self._detection_active():
+                try:
+                    self._detect_q.put_nowait(True)
+                except queue.Full:
+                    pass
+        except Exception as e:
+            self._stop_loop(e)
+            return
 
-            # FPS limiting for UI
-            elapsed = time.time() - loop_start
-            await asyncio.sleep(max(0, ui_interval - elapsed))
+        self._detect_deadline = self._next_deadline(
+            self._detect_deadline, self._detection_interval
+        )
+        self._detect_handle = self.loop.call_at(self._detect_deadline, self._tick_detect)
+
+    def _detection_active(self) -> bool:
+        """Whether frames would be analyzed now (enabled, connected, not in cooldown)."""
+        if self.state.flags & _DETECTION_READY != _DETECTION_READY:
+            return False
+
+        return time.monotonic() - self._last_death_time > self._death_cooldown
+
+    def _grab_detection_frame(self):
+        """Grab the detection region (runs on the capture stream thread)."""
+        # Don't capture frames nobody will look at
+        if not self._detection_active():
+            return None
+
+        return self._grab_region()
+
+    def _set_region(self, spec: RegionSpec):
+        """Switch the detection region and the grab function specialized for it."""
+        self._region = spec
+        self._grab_region = self._make_region_grabber(spec)
+
+    def _make_region_grabber(self, spec: RegionSpec) -> Callable[[], np.ndarray | None]:
+        """Build the grab function for spec, so per-frame grabs don't re-branch on the mode."""
+        capture = self.capture
+
+        # Plain screen region or whole monitor (grayscale - OCR only needs luminance)
+        if not spec.window_name:
+            if spec.legacy:
+                return partial(capture.grab_region_gray, *spec.legacy)
+            return capture.grab_gray
+
+        # Window-specific capture ignores windows on top
+        window_grab = None
+        if spec.has_window_region:
+            window_grab = partial(
+                capture_window_region,
+                spec.window_name, spec.x_pct, spec.y_pct, spec.w_pct, spec.h_pct,
+            )
 
-        if ws_task:
-            ws_task.cancel()
+        def grab_window_region():
+            if window_grab is not None:
+                frame = window_grab()
+                if frame is not None:
+                    return frame
+
+            # Fallback to screen capture where the window (or its fallback) is
+            region = self._get_detection_region()
+            if region:
+                return capture.grab_region_gray(*region)
+            return capture.grab_gray()
+
+        return grab_window_region
+
+    def _detect_worker(self):
+        """Detection thread: run one detection per token until None arrives."""
+        while self._detect_q.get() is not None:
+            self._run_detection_sync()
+
+    def _stop_detect_worker(self):
+        """Stop the detection thread, discarding any pending run."""
+        try:
+            self._detect_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._detect_q.put(None)
+        self._detect_thread.join(timeout=2.0)
+        self._detect_thread = None
 
     def _run_detection_sync(self):
         """Run detection synchronously in background thread."""
         try:
-            frame = None
-
-            # Check for window-relative region (captures only target window)
-            window_name = self.config.get('detection.region.window_name', '')
-            if window_name:
-                x_pct = self.config.get('detection.region.x_percent', 0)
-                y_pct = self.config.get('detection.region.y_percent', 0)
-                w_pct = self.config.get('detection.region.w_percent', 0)
-                h_pct = self.config.get('detection.region.h_percent', 0)
-
-                if w_pct > 0 and h_pct > 0:
-                    # Use window-specific capture (ignores windows on top)
-                    frame = capture_window_region(window_name, x_pct, y_pct, w_pct, h_pct)
-
-            # Fallback to screen capture
-            if frame is None:
-                region = self._get_detection_region()
-                if region:
-                    x, y, w, h = region
-                    frame = self.capture.grab_region(x, y, w, h)
-                else:
-                    frame = self.capture.grab()
+            seq, frame = self.capture.get_latest()
 
-            if frame is not None:
-                is_dead, confidence = self.detector.check_death(frame)
-                self._detection_result = (is_dead, confidence)
-            else:
-                self._detection_result = (False, 0.0)
+            # Nothing new since the last run - don't count the same frame twice
+            if frame is None or seq == self._last_frame_seq:
+                return
+            self._last_frame_seq = seq
+
+            # A frame that barely differs from one that didn't match won't
+            # match either. Matching frames always rerun so the confirmation
+            # streak can build.
+            if self._skip_unchanged and self._frame_unchanged(frame):
+                return
+
+            is_dead, confidence = self.detector.check_death(frame)
         except Exception as e:
-            print(f"[Detection] Error: {e}", flush=True)
-            self._detection_result = (False, 0.0)
-        finally:
-            self._detection_running = False
+            log.warning(f"[Detection] Error: {e}")
+            is_dead, confidence = False, 0.0
+
+        # Hand the result to the event loop instead of having it poll for one
+        try:
+            self.loop.call_soon_threadsafe(self._on_detection_complete, is_dead, confidence)
+        except RuntimeError:
+            pass  # Loop closed during shutdown
+
+    def _on_detection_complete(self, is_dead: bool, confidence: float):
+        """Handle a detection result (runs on the event loop)."""
+        # Debug: show detection status periodically
+        if hasattr(self, '_debug_counter'):
+            self._debug_counter += 1
+        else:
+            self._debug_counter = 0
+
+        if self._debug_counter % 10 == 0 and log.isEnabledFor(logging.DEBUG):  # Every second
+            method = self.detector.last_method or "none"
+            log.debug(f"[Debug] Detection: match={is_dead}, conf={confidence:.2f}, method={method}")
+
+        now = time.monotonic()
+        if is_dead and now - self._last_death_time > self._death_cooldown:
+            self._last_death_time = now
+            self._post(self._handle_death)
+
+    def _frame_unchanged(self, frame) -> bool:
+        """Compare a 32x32 thumbnail of frame against the last analyzed one."""
+        thumb = cv2.resize(frame, (_THUMB_SIZE, _THUMB_SIZE), interpolation=cv2.INTER_AREA)
+        prev = self._prev_thumb
+        if (
+            prev is not None
+            and prev.shape == thumb.shape
+            and not self.detector.consecutive_hits
+            and cv2.norm(thumb, prev, cv2.NORM_L1) < self._diff_threshold * thumb.size
+        ):
+            return True
+
+        self._prev_thumb = thumb
+        return False
 
     async def _handle_death(self):
         """Handle detected death."""
-        print("[Detector] Death detected!", flush=True)
+        log.info("[Detector] Death detected!")
 
         if self.state.boss_mode:
-            print("[WS] Sending boss death...", flush=True)
-            await self.ws.send_boss_death()
+            log.info("[WS] Sending boss death...")
+            await self._ws_send_boss_death()
         else:
-            print("[WS] Sending death...", flush=True)
-            await self.ws.send_death()
-        print(f"[WS] Sent! Deaths count: {self.state.deaths}", flush=True)
+            log.info("[WS] Sending death...")
+            await self._ws_send_death()
+        log.info(f"[WS] Sent! Deaths count: {self.state.deaths}")
+
+    def _bind_ws_methods(self):
+        """Cache bound BBWebSocket methods used by UI/hotkey callbacks."""
+        ws = self.ws
+        self._ws_add_milestone = ws.add_milestone
+        self._ws_add_stats = ws.add_stats
+        self._ws_boss_cancel = ws.boss_cancel
+        self._ws_boss_pause = ws.boss_pause
+        self._ws_boss_resume = ws.boss_resume
+        self._ws_boss_start = ws.boss_start
+        self._ws_boss_victory = ws.boss_victory
+        self._ws_delete_milestone = ws.delete_milestone
+        self._ws_delete_stats = ws.delete_stats
+        self._ws_reset = ws.reset
+        self._ws_send_boss_death = ws.send_boss_death
+        self._ws_send_death = ws.send_death
+        self._ws_start_timer = ws.start_timer
+        self._ws_stop_timer = ws.stop_timer
+
+    def _post(self, coro_fn, *args):
+        """Schedule coro_fn(*args) on the event loop from any thread."""
+        self._submit_q.append((coro_fn, args))
+        if not self._drain_pending:
+            self._drain_pending = True
+            self.loop.call_soon_threadsafe(self._drain_submit_q)
+
+    def _drain_submit_q(self):
+        """Start queued WebSocket calls (runs on the event loop)."""
+        # Clear before draining so posts racing with us schedule a new drain
+        self._drain_pending = False
+        pending = self._submit_q
+        while pending:
+            coro_fn, args = pending.popleft()
+            task = self.loop.create_task(coro_fn(*args))
+            # The loop only keeps weak references to tasks
+            self._ws_tasks.add(task)
+            task.add_done_callback(self._ws_tasks.discard)
 
     # === WebSocket callbacks ===
 
     def _on_ws_state(self, data: dict):
         """Handle server state update."""
-        self.state.update_from_server(data)
-        self.state.set('connected', True)
+        self.state.update_from_server(data, extra={'connected': True})
 
     def _on_ws_connect(self):
         """Handle WebSocket connect."""
         self.state.set('connected', True)
-        print("[WS] Connected", flush=True)
+        log.info("[WS] Connected")
 
     def _on_ws_disconnect(self):
         """Handle WebSocket disconnect."""
-        self.state.set('connected', False)
-        self.state.set('can_edit', False)
-        print("[WS] Disconnected", flush=True)
+        self.state.update({'connected': False, 'can_edit': False})
+        log.info("[WS] Disconnected")
 
     # === UI Callbacks ===
 
@@ -370,86 +640,79 @@ class BBDetectorApp:
         if not self.state.connected or not self.loop:
             return
 
-        asyncio.run_coroutine_threadsafe(
-            self.ws.send_boss_death() if self.state.boss_mode else self.ws.send_death(),
-            self.loop
-        )
+        # Boss vs normal death is decided on the loop, when the message is sent
+        self._post(self._send_death)
+
+    async def _send_death(self):
+        """Send a boss death if a boss fight is active, else a normal death."""
+        if self.state.boss_mode:
+            await self._ws_send_boss_death()
+        else:
+            await self._ws_send_death()
 
     def _on_timer_start(self):
         """Handle timer start."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(self.ws.start_timer(), self.loop)
+            self._post(self._ws_start_timer)
 
     def _on_timer_stop(self):
         """Handle timer stop."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(self.ws.stop_timer(), self.loop)
+            self._post(self._ws_stop_timer)
 
     def _on_timer_reset(self):
         """Handle timer reset."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(self.ws.reset(), self.loop)
+            self._post(self._ws_reset)
 
     def _on_boss_start(self):
         """Handle boss start."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(self.ws.boss_start(), self.loop)
+            self._post(self._ws_boss_start)
 
     def _on_boss_pause(self):
         """Handle boss pause."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(self.ws.boss_pause(), self.loop)
+            self._post(self._ws_boss_pause)
 
     def _on_boss_resume(self):
         """Handle boss resume."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(self.ws.boss_resume(), self.loop)
+            self._post(self._ws_boss_resume)
 
     def _on_boss_victory(self, name: str):
         """Handle boss victory."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(self.ws.boss_victory(name), self.loop)
+            self._post(self._ws_boss_victory, name)
 
     def _on_boss_cancel(self):
         """Handle boss cancel."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(self.ws.boss_cancel(), self.loop)
+            self._post(self._ws_boss_cancel)
 
     # === Milestone Callbacks ===
 
     def _on_add_milestone(self, name: str, icon: str):
         """Handle add milestone."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(
-                self.ws.add_milestone(name, icon),
-                self.loop
-            )
+            self._post(self._ws_add_milestone, name, icon)
 
     def _on_delete_milestone(self, milestone_id: str):
         """Handle delete milestone."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(
-                self.ws.delete_milestone(milestone_id),
-                self.loop
-            )
+            self._post(self._ws_delete_milestone, milestone_id)
 
     # === Stats Callbacks ===
 
     def _on_add_stats(self, stats: dict):
         """Handle add character stats."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(
-                self.ws.add_stats(stats),
-                self.loop
-            )
+            self._post(self._ws_add_stats, stats)
 
     def _on_delete_stats(self, stats_id: str):
         """Handle delete character stats."""
         if self.loop and self.state.connected:
-            asyncio.run_coroutine_threadsafe(
-                self.ws.delete_stats(stats_id),
-                self.loop
-            )
+            self._post(self._ws_delete_stats, stats_id)
 
     def _on_toggle_boss(self):
         """Toggle boss mode (hotkey)."""
@@ -462,7 +725,7 @@ class BBDetectorApp:
         """Toggle detection on/off."""
         self.state.set('detection_enabled', not self.state.detection_enabled)
         status = "ON" if self.state.detection_enabled else "OFF"
-        print(f"[App] Detection: {status}", flush=True)
+        log.info(f"[App] Detection: {status}")
 
     def _on_toggle_mode(self):
         """Toggle compact/full mode."""
@@ -480,20 +743,16 @@ class BBDetectorApp:
 
     def _on_profile_select(self, name: str, password: str, is_new: bool):
         """Handle profile selection."""
+        # Profile creation does network I/O - never block the UI on it
+        self._post(self._select_profile, name, password, is_new)
+
+    async def _select_profile(self, name: str, password: str, is_new: bool):
+        """Create (if new) and switch to a profile, then reconnect."""
         if is_new:
-            # Create profile via API
-            import requests
-            try:
-                resp = requests.post(
-                    'https://soulsdeaths.somework.dev/api/bb-profiles',
-                    json={'name': name, 'password': password},
-                    timeout=5
-                )
-                if not resp.ok:
-                    print(f"[App] Failed to create profile: {resp.text}", flush=True)
-                    return
-            except Exception as e:
-                print(f"[App] Failed to create profile: {e}", flush=True)
+            created = await self.loop.run_in_executor(
+                None, self._create_profile, name, password
+            )
+            if not created:
                 return
 
         # Save to config
@@ -501,27 +760,43 @@ class BBDetectorApp:
         self.config.set('profile.password', password)
         self.config.save()
 
-        # Reconnect WebSocket with new profile
-        if self.ws and self.loop:
-            asyncio.run_coroutine_threadsafe(self.ws.disconnect(), self.loop)
+        # Reconnect the existing WebSocket client with the new profile
+        await self.ws.set_credentials(name, password)
+        if not self.ws.running:
+            self._post(self.ws.connect)
 
-        self.ws = BBWebSocket(
-            profile=name,
-            password=password,
-            on_state=self._on_ws_state,
-            on_connect=self._on_ws_connect,
-            on_disconnect=self._on_ws_disconnect
-        )
+    def _create_profile(self, name: str, password: str) -> bool:
+        """Create profile via API (blocking, runs in executor)."""
+        if self._http is None:
+            import requests
+            self._http = requests.Session()
 
-        if self.loop:
-            asyncio.run_coroutine_threadsafe(self.ws.connect(), self.loop)
+        try:
+            resp = self._http.post(
+                'https://soulsdeaths.somework.dev/api/bb-profiles',
+                json={'name': name, 'password': password},
+                timeout=5
+            )
+            if not resp.ok:
+                log.warning(f"[App] Failed to create profile: {resp.text}")
+                return False
+        except Exception as e:
+            log.warning(f"[App] Failed to create profile: {e}")
+            return False
+        return True
 
     def _on_capture(self):
         """Capture current screen for calibration."""
-        return self.capture.grab()
+        # Calibration keeps the frame, so grab into a fresh buffer
+        return self.capture.grab_into()
 
-    def _on_capture_region(self, region: dict):
-        """Capture specific screen region for calibration."""
+    def _on_capture_region(self, region: dict, copy: bool = False):
+        """Capture specific screen region for calibration.
+
+        Without ``copy`` the frame is a view into a buffer owned by the live
+        preview, which the next such call overwrites; callers that keep the
+        frame pass ``copy=True``.
+        """
         # Support window-relative regions - use window-specific capture
         if 'window_name' in region and region.get('w_percent', 0) > 0:
             # Use capture_window_region - captures only target window, ignores windows on top
@@ -536,10 +811,13 @@ class BBDetectorApp:
                 return frame
             # Fallback to screen capture if window not found
 
-        # Fallback: standard screen capture
-        frame = self.capture.grab()
+        # Fallback: standard screen capture. Never the capture's own buffer:
+        # other grabs (detection stream, calibration) overwrite it in place.
+        frame = self.capture.grab_into(None if copy else self._preview_buf)
         if frame is None:
             return None
+        if not copy:
+            self._preview_buf = frame
 
         # Legacy absolute region
         x = region.get('x', 0)
@@ -558,7 +836,8 @@ class BBDetectorApp:
         w = min(w, frame_w - x)
         h = min(h, frame_h - y)
 
-        return frame[y:y+h, x:x+w]
+        frame = frame[y:y+h, x:x+w]
+        return frame.copy() if copy else frame
 
     def _on_save_region(self, region: dict):
         """Save screen region to config."""
@@ -595,6 +874,13 @@ class BBDetectorApp:
             self.config.set('detection.region.window_name', '')
 
         self.config.save()
+        self._set_region(RegionSpec.from_config(self.config))
+
+    def _on_settings_saved(self):
+        """Apply settings written by Setup (cooldown, game)."""
+        self._load_detection_settings()
+        # Game switch changes keywords and tesseract settings
+        self.detector.reload(self.config)
 
     def _on_test_detection(self, frame):
         """Test detection on frame."""
@@ -602,28 +888,35 @@ class BBDetectorApp:
 
     def _on_quit(self):
         """Handle quit."""
-        print("[App] Quit", flush=True)
+        log.info("[App] Quit")
         self.running = False
 
     def _shutdown(self):
         """Cleanup and shutdown."""
-        print("[App] Shutting down...", flush=True)
+        log.info("[App] Shutting down...")
 
         if self.hotkeys:
             self.hotkeys.stop()
 
+        if self._detect_thread:
+            self._stop_detect_worker()
+
         if self.capture:
             self.capture.stop()
 
         if self.loop and self.ws:
             self.loop.run_until_complete(self.ws.disconnect())
 
+        if self._http:
+            self._http.close()
+
         if self.app:
             self.app.destroy()
 
-        self.config.save()
+        # Runtime changes are saved as they're made; usually nothing is left
+        self.config.save_if_dirty()
 
-        print("[App] Goodbye!", flush=True)
+        log.info("[App] Goodbye!")
 
 
 def main():
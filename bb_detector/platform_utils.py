@@ -1,8 +1,10 @@
 # bb_detector/platform_utils.py
 import platform
 import subprocess
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Optional
 
+@lru_cache(maxsize=1)
 def get_platform() -> str:
     system = platform.system()
     if system == 'Windows':
@@ -27,21 +29,38 @@ def get_scale_factor() -> float:
         return 1.0
 
 
-def check_macos_permissions() -> Dict[str, bool]:
+# Last macOS permission probe (None until the first check)
+_macos_permissions: Optional[Dict[str, bool]] = None
+
+
+def check_macos_permissions(force: bool = False) -> Dict[str, bool]:
+    """Screen Recording / Accessibility status, probed once per process.
+
+    Pass ``force=True`` to probe again (e.g. after the user granted access).
+    """
+    global _macos_permissions
+
     if get_platform() != 'macos':
         return {'screen': True, 'accessibility': True}
 
+    if _macos_permissions is None or force:
+        _macos_permissions = _probe_macos_permissions()
+    return dict(_macos_permissions)
+
+
+def _probe_macos_permissions() -> Dict[str, bool]:
     result = {'screen': False, 'accessibility': False}
 
     # Check Screen Recording
+    # Without the permission the grab comes back blank; a small corner of
+    # the main display is enough to tell
     try:
         import mss
-        sct = mss.mss()
-        frame = sct.grab(sct.monitors[1])
-        import numpy as np
-        arr = np.array(frame)
-        if arr.sum() > 0:
-            result['screen'] = True
+        with mss.mss() as sct:
+            main = sct.monitors[1]
+            frame = sct.grab({'left': main['left'], 'top': main['top'], 'width': 64, 'height': 64})
+        # Same test as a numpy sum > 0, without importing numpy or copying
+        result['screen'] = any(frame.raw)
     except Exception:
         pass
 
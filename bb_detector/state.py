@@ -1,9 +1,31 @@
 # bb_detector/state.py
-from typing import Any, Callable, Dict, List
+import logging
+from typing import Any, Callable, Dict, Tuple
 from dataclasses import dataclass
 
+log = logging.getLogger(__name__)
 
-@dataclass
+# Boolean state mirrored into StateManager.flags for single-test hot checks
+FLAG_DETECTION = 1
+FLAG_CONNECTED = 2
+FLAG_BOSS = 4
+FLAG_RUNNING = 8
+FLAG_CAN_EDIT = 16
+
+_FLAG_KEYS = {
+    'detection_enabled': FLAG_DETECTION,
+    'connected': FLAG_CONNECTED,
+    'boss_mode': FLAG_BOSS,
+    'is_running': FLAG_RUNNING,
+    'can_edit': FLAG_CAN_EDIT,
+}
+
+# Key passed to subscribers for a batched update; the value is a dict of
+# every key that changed
+BATCH_KEY = '*'
+
+
+@dataclass(frozen=True, slots=True)
 class Milestone:
     """A milestone/checkpoint in the game."""
     id: str
@@ -13,7 +35,7 @@ class Milestone:
     created_at: str  # ISO 8601
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DeathTimestamp:
     """Record of when a death occurred."""
     timestamp: int  # ms from session start
@@ -21,7 +43,7 @@ class DeathTimestamp:
     created_at: str = ""  # ISO 8601 real-world timestamp
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BossFight:
     """Record of a boss fight."""
     id: str
@@ -34,7 +56,7 @@ class BossFight:
     created_at: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CharacterStats:
     """Character stats snapshot."""
     id: str
@@ -52,6 +74,80 @@ class CharacterStats:
     created_at: str
 
 
+def _parse_milestone(m: Dict[str, Any]) -> Milestone:
+    return Milestone(
+        id=m.get('id', ''),
+        name=m.get('name', ''),
+        timestamp=m.get('timestamp', 0),
+        icon=m.get('icon', '★'),
+        created_at=m.get('createdAt', '')
+    )
+
+
+def _parse_death_timestamp(d: Dict[str, Any]) -> DeathTimestamp:
+    return DeathTimestamp(
+        timestamp=d.get('timestamp', 0),
+        death_number=d.get('deathNumber', 0),
+        created_at=d.get('createdAt', '')
+    )
+
+
+def _parse_boss_fight(b: Dict[str, Any]) -> BossFight:
+    return BossFight(
+        id=b.get('id', ''),
+        name=b.get('name', ''),
+        duration=b.get('duration', 0),
+        deaths_on_boss=b.get('deathsOnBoss', 0),
+        deaths_total_before=b.get('deathsTotalBefore', 0),
+        start_time=b.get('startTime', 0),
+        end_time=b.get('endTime', 0),
+        created_at=b.get('createdAt', '')
+    )
+
+
+def _parse_character_stats(s: Dict[str, Any]) -> CharacterStats:
+    return CharacterStats(
+        id=s.get('id', ''),
+        timestamp=s.get('timestamp', 0),
+        level=s.get('level', 0),
+        vitality=s.get('vitality', 0),
+        endurance=s.get('endurance', 0),
+        strength=s.get('strength', 0),
+        skill=s.get('skill', 0),
+        bloodtinge=s.get('bloodtinge', 0),
+        arcane=s.get('arcane', 0),
+        blood_echoes=s.get('bloodEchoes', 0),
+        insight=s.get('insight', 0),
+        notes=s.get('notes', ''),
+        created_at=s.get('createdAt', '')
+    )
+
+
+# (server key, state key) for the scalar fields of bb-state
+_SERVER_KEYS = (
+    ('deaths', 'deaths'),
+    ('elapsed', 'elapsed'),
+    ('isRunning', 'is_running'),
+    ('bossFightMode', 'boss_mode'),
+    ('bossDeaths', 'boss_deaths'),
+    ('bossPaused', 'boss_paused'),
+    ('canEdit', 'can_edit'),
+    ('profileName', 'profile'),
+    ('displayName', 'profile_display_name'),
+)
+
+# Distinguishes a missing server key from an explicit null
+_MISSING = object()
+
+# (server key, state key, parser) for the list fields of bb-state
+_SERVER_LISTS = (
+    ('milestones', 'milestones', _parse_milestone),
+    ('deathTimestamps', 'death_timestamps', _parse_death_timestamp),
+    ('bossFights', 'boss_fights', _parse_boss_fight),
+    ('characterStats', 'character_stats', _parse_character_stats),
+)
+
+
 class StateManager:
     """Centralized state management with subscriber notifications."""
 
@@ -74,7 +170,18 @@ class StateManager:
             'boss_fights': [],  # List[BossFight]
             'character_stats': [],  # List[CharacterStats]
         }
-        self._subscribers: List[Callable[[str, Any], None]] = []
+        # Subscribers to every change, and to single keys. Stored as tuples
+        # (rebuilt on subscribe/unsubscribe) so notifying never copies.
+        self._wildcards: Tuple[Callable[[str, Any], None], ...] = ()
+        self._subscribers: Dict[str, Tuple[Callable[[str, Any], None], ...]] = {}
+
+        # Raw server lists behind the parsed list keys above, by server key
+        self._server_lists: Dict[str, list] = {}
+
+        # Bitmask of the boolean keys above, kept in sync by set()
+        self.flags = FLAG_DETECTION
+        # Bumped on every change, so pollers can spot staleness with one compare
+        self.version = 0
 
     def __getattr__(self, name: str) -> Any:
         if name.startswith('_'):
@@ -87,108 +194,110 @@ class StateManager:
         return self._state.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        if key in self._state:
-            old_value = self._state[key]
-            if old_value != value:
-                self._state[key] = value
-                self._notify(key, value)
+        if self._apply(key, value):
+            self._notify(key, value)
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several keys with a single (BATCH_KEY, changes) notification."""
+        changes = {
+            key: value for key, value in values.items()
+            if self._apply(key, value)
+        }
+        if not changes:
+            return
+
+        for callback in self._wildcards:
+            self._call(callback, BATCH_KEY, changes)
+        if self._subscribers:
+            for key, value in changes.items():
+                for callback in self._subscribers.get(key, ()):
+                    self._call(callback, key, value)
+
+    def _apply(self, key: str, value: Any) -> bool:
+        """Store value if key is known and the value differs; return True if changed."""
+        old = self._state.get(key, _MISSING)
+        # Identity first: list == would walk every element even for the same list
+        if old is _MISSING or old is value or old == value:
+            return False
+
+        self._state[key] = value
+        self.version += 1
+        flag = _FLAG_KEYS.get(key)
+        if flag:
+            if value:
+                self.flags |= flag
+            else:
+                self.flags &= ~flag
+        return True
+
+    def subscribe(self, callback: Callable[[str, Any], None], key: str | None = None) -> None:
+        """Call callback(key, value) on changes.
 
-    def subscribe(self, callback: Callable[[str, Any], None]) -> None:
-        self._subscribers.append(callback)
+        Without ``key`` the callback sees every change, with batched updates
+        arriving as (BATCH_KEY, changes). With ``key`` it only sees that key,
+        including when it changes as part of a batch.
+        """
+        if key is None:
+            self._wildcards += (callback,)
+        else:
+            self._subscribers[key] = self._subscribers.get(key, ()) + (callback,)
 
-    def unsubscribe(self, callback: Callable[[str, Any], None]) -> None:
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+    def unsubscribe(self, callback: Callable[[str, Any], None], key: str | None = None) -> None:
+        if key is None:
+            self._wildcards = tuple(cb for cb in self._wildcards if cb != callback)
+        elif key in self._subscribers:
+            remaining = tuple(cb for cb in self._subscribers[key] if cb != callback)
+            if remaining:
+                self._subscribers[key] = remaining
+            else:
+                del self._subscribers[key]
 
     def _notify(self, key: str, value: Any) -> None:
-        for callback in self._subscribers:
-            try:
-                callback(key, value)
-            except Exception as e:
-                print(f"[State] Subscriber error for {key}: {e}", flush=True)
-
-    def update_from_server(self, data: Dict[str, Any]) -> None:
-        """Update state from server bb-state message."""
-        mapping = {
-            'deaths': 'deaths',
-            'elapsed': 'elapsed',
-            'isRunning': 'is_running',
-            'bossFightMode': 'boss_mode',
-            'bossDeaths': 'boss_deaths',
-            'bossPaused': 'boss_paused',
-            'canEdit': 'can_edit',
-            'profileName': 'profile',
-            'displayName': 'profile_display_name',
-        }
+        for callback in self._subscribers.get(key, ()):
+            self._call(callback, key, value)
+        for callback in self._wildcards:
+            self._call(callback, key, value)
+
+    @staticmethod
+    def _call(callback: Callable[[str, Any], None], key: str, value: Any) -> None:
+        try:
+            callback(key, value)
+        except Exception as e:
+            log.warning(f"[State] Subscriber error for {key}: {e}")
+
+    def update_from_server(self, data: Dict[str, Any], extra: Dict[str, Any] | None = None) -> None:
+        """Update state from server bb-state message.
+
+        Everything (including the local ``extra`` keys) is applied as one
+        batched update.
+        """
+        updates = dict(extra) if extra else {}
+        for server_key, local_key in _SERVER_KEYS:
+            value = data.get(server_key, _MISSING)
+            if value is not _MISSING:
+                updates[local_key] = value
+
+        # Parse history lists (skipped when the server sent the same list)
+        for server_key, local_key, parse in _SERVER_LISTS:
+            if self._server_list_changed(data, server_key):
+                updates[local_key] = list(map(parse, data[server_key]))
+
+        self.update(updates)
+
+    def _server_list_changed(self, data: Dict[str, Any], server_key: str) -> bool:
+        """Whether data carries a list that differs from the last one seen.
+
+        Comparing the raw dicts is much cheaper than rebuilding the
+        dataclass list just to find it equal to the current one.
+        """
+        if server_key not in data:
+            return False
 
-        for server_key, local_key in mapping.items():
-            if server_key in data:
-                self.set(local_key, data[server_key])
-
-        # Parse milestones
-        if 'milestones' in data:
-            milestones = []
-            for m in data.get('milestones', []):
-                milestones.append(Milestone(
-                    id=m.get('id', ''),
-                    name=m.get('name', ''),
-                    timestamp=m.get('timestamp', 0),
-                    icon=m.get('icon', '★'),
-                    created_at=m.get('createdAt', '')
-                ))
-            self._state['milestones'] = milestones
-            self._notify('milestones', milestones)
-
-        # Parse death timestamps
-        if 'deathTimestamps' in data:
-            death_timestamps = []
-            for d in data.get('deathTimestamps', []):
-                death_timestamps.append(DeathTimestamp(
-                    timestamp=d.get('timestamp', 0),
-                    death_number=d.get('deathNumber', 0),
-                    created_at=d.get('createdAt', '')
-                ))
-            self._state['death_timestamps'] = death_timestamps
-            self._notify('death_timestamps', death_timestamps)
-
-        # Parse boss fights
-        if 'bossFights' in data:
-            boss_fights = []
-            for b in data.get('bossFights', []):
-                boss_fights.append(BossFight(
-                    id=b.get('id', ''),
-                    name=b.get('name', ''),
-                    duration=b.get('duration', 0),
-                    deaths_on_boss=b.get('deathsOnBoss', 0),
-                    deaths_total_before=b.get('deathsTotalBefore', 0),
-                    start_time=b.get('startTime', 0),
-                    end_time=b.get('endTime', 0),
-                    created_at=b.get('createdAt', '')
-                ))
-            self._state['boss_fights'] = boss_fights
-            self._notify('boss_fights', boss_fights)
-
-        # Parse character stats
-        if 'characterStats' in data:
-            character_stats = []
-            for s in data.get('characterStats', []):
-                character_stats.append(CharacterStats(
-                    id=s.get('id', ''),
-                    timestamp=s.get('timestamp', 0),
-                    level=s.get('level', 0),
-                    vitality=s.get('vitality', 0),
-                    endurance=s.get('endurance', 0),
-                    strength=s.get('strength', 0),
-                    skill=s.get('skill', 0),
-                    bloodtinge=s.get('bloodtinge', 0),
-                    arcane=s.get('arcane', 0),
-                    blood_echoes=s.get('bloodEchoes', 0),
-                    insight=s.get('insight', 0),
-                    notes=s.get('notes', ''),
-                    created_at=s.get('createdAt', '')
-                ))
-            self._state['character_stats'] = character_stats
-            self._notify('character_stats', character_stats)
+        items = data[server_key]
+        if items == self._server_lists.get(server_key):
+            return False
+        self._server_lists[server_key] = items
+        return True
 
     def to_dict(self) -> Dict[str, Any]:
         return self._state.copy()
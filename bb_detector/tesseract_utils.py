@@ -13,10 +13,10 @@ import sys
 import shutil
 import zipfile
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import urllib.request
-import ssl
 
 from .platform_utils import get_platform
 
@@ -27,6 +27,9 @@ TESSERACT_PORTABLE_URL = "https://github.com/UB-Mannheim/tesseract/releases/down
 TESSDATA_ENG_URL = "https://github.com/tesseract-ocr/tessdata_fast/raw/main/eng.traineddata"
 
 # Alternative mirrors (in case GitHub is blocked)
+# (connect, read) seconds; a dead mirror fails fast instead of blocking the rest
+HTTP_TIMEOUT = (10, 60)
+
 TESSDATA_MIRRORS = [
     "https://github.com/tesseract-ocr/tessdata_fast/raw/main/eng.traineddata",
     "https://raw.githubusercontent.com/tesseract-ocr/tessdata_fast/main/eng.traineddata",
@@ -50,6 +53,7 @@ def get_tesseract_dir() -> Path:
     return get_app_data_dir() / 'tesseract'
 
 
+@lru_cache(maxsize=1)
 def get_bundled_tesseract_path() -> Optional[Path]:
     """
     Get path to bundled Tesseract (for PyInstaller builds).
@@ -81,6 +85,7 @@ def get_bundled_tesseract_path() -> Optional[Path]:
     return None
 
 
+@lru_cache(maxsize=1)
 def get_tesseract_cmd() -> str:
     """
     Get path to tesseract executable.
@@ -88,9 +93,8 @@ def get_tesseract_cmd() -> str:
     # Check bundled/downloaded first
     bundled_dir = get_bundled_tesseract_path()
     if bundled_dir:
-        tesseract_exe = bundled_dir / 'tesseract.exe'
-        if tesseract_exe.exists():
-            return str(tesseract_exe)
+        # get_bundled_tesseract_path() only returns dirs containing the exe
+        return str(bundled_dir / 'tesseract.exe')
 
     # Check PATH
     tesseract_in_path = shutil.which('tesseract')
@@ -111,13 +115,18 @@ def get_tesseract_cmd() -> str:
     return 'tesseract'
 
 
+@lru_cache(maxsize=1)
 def get_tessdata_dir() -> Optional[str]:
     """Get path to tessdata directory."""
     bundled_dir = get_bundled_tesseract_path()
     if bundled_dir:
         tessdata = bundled_dir / 'tessdata'
-        if tessdata.exists() and any(tessdata.glob('*.traineddata')):
-            return str(tessdata)
+        try:
+            with os.scandir(tessdata) as it:
+                if any(e.name.endswith('.traineddata') for e in it):
+                    return str(tessdata)
+        except OSError:
+            pass
 
     env_tessdata = os.environ.get('TESSDATA_PREFIX')
     if env_tessdata and os.path.exists(env_tessdata):
@@ -126,43 +135,125 @@ def get_tessdata_dir() -> Optional[str]:
     return None
 
 
+def _invalidate_tesseract_cache():
+    """Forget resolved Tesseract paths (after installing a new copy)."""
+    get_bundled_tesseract_path.cache_clear()
+    get_tesseract_cmd.cache_clear()
+    get_tessdata_dir.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _http_session():
+    """Shared HTTP session: pooled connections plus retry with backoff."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    session = requests.Session()
+    # Byte counts and ranges must match the file on disk, not a gzip stream
+    session.headers.update({'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'identity'})
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 def download_file(url: str, dest: Path, desc: str = "", progress_callback=None) -> bool:
     """Download file with progress."""
     try:
         print(f"[Tesseract] Downloading {desc or url}...")
 
-        # Create SSL context that works with most systems
-        ctx = ssl.create_default_context()
-
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-
-        with urllib.request.urlopen(req, context=ctx, timeout=60) as response:
+        with _http_session().get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
+            response.raise_for_status()
             total = int(response.headers.get('Content-Length', 0))
             downloaded = 0
-            chunk_size = 8192
+            last_report = 0
+            chunk_size = 512 * 1024
 
             with open(dest, 'wb') as f:
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
+                for chunk in response.iter_content(chunk_size):
                     f.write(chunk)
                     downloaded += len(chunk)
 
                     if progress_callback and total > 0:
                         progress_callback(downloaded, total)
-                    elif total > 0:
+                    elif total > 0 and (downloaded - last_report >= 1 << 20 or downloaded == total):
+                        last_report = downloaded
                         pct = int(downloaded * 100 / total)
                         print(f"\r[Tesseract]   {pct}%", end='', flush=True)
 
         print()
+        # Check the byte count as we go rather than re-reading the file
+        if total > 0 and downloaded != total:
+            raise OSError(f"got {downloaded} of {total} bytes")
         return True
 
     except Exception as e:
         print(f"\n[Tesseract] Download failed: {e}")
+        # Don't leave a truncated file that later looks like a finished download
+        dest.unlink(missing_ok=True)
+        return False
+
+
+def _download_ranged(url: str, dest: Path, n_chunks: int = 4) -> bool:
+    """
+    Download file as n_chunks parallel HTTP Range requests.
+
+    Returns False (without raising) if the server doesn't serve ranges
+    or any part fails, so the caller can fall back to download_file().
+    """
+    try:
+        session = _http_session()
+
+        with session.head(url, allow_redirects=True, timeout=HTTP_TIMEOUT) as response:
+            response.raise_for_status()
+            total = int(response.headers.get('Content-Length', 0))
+            if response.headers.get('Accept-Ranges') != 'bytes' or total <= 0:
+                return False
+            # Resolve redirects once instead of per part
+            url = response.url
+
+        step = -(-total // n_chunks)
+        with open(dest, 'wb') as f:
+            f.truncate(total)
+
+        def fetch(lo: int):
+            hi = min(lo + step, total) - 1
+            headers = {'Range': f'bytes={lo}-{hi}'}
+            with session.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+                if response.status_code != 206:
+                    raise OSError(f"expected 206, got {response.status_code}")
+                with open(dest, 'r+b') as f:
+                    f.seek(lo)
+                    for chunk in response.iter_content(512 * 1024):
+                        f.write(chunk)
+                    if f.tell() != hi + 1:
+                        raise OSError(f"short read for bytes {lo}-{hi}")
+
+        print(f"[Tesseract] Downloading {url} in {n_chunks} parts...")
+        with ThreadPoolExecutor(max_workers=n_chunks) as pool:
+            list(pool.map(fetch, range(0, total, step)))
+        return True
+
+    except Exception as e:
+        print(f"[Tesseract] Ranged download failed: {e}")
+        dest.unlink(missing_ok=True)
         return False
 
 
+def _probe_mirror(url: str) -> str:
+    """Return url if the mirror answers a HEAD request, else raise."""
+    with _http_session().head(url, allow_redirects=True, timeout=HTTP_TIMEOUT) as response:
+        response.raise_for_status()
+    return url
+
+
 def download_tessdata(tesseract_dir: Path) -> bool:
     """Download tessdata (eng.traineddata)."""
     tessdata_dir = tesseract_dir / 'tessdata'
@@ -173,10 +264,21 @@ def download_tessdata(tesseract_dir: Path) -> bool:
         print(f"[Tesseract] Tessdata already exists: {eng_file}")
         return True
 
-    # Try mirrors
-    for url in TESSDATA_MIRRORS:
-        if download_file(url, eng_file, "eng.traineddata"):
-            return True
+    # Probe all mirrors at once and try them in the order they answer
+    pool = ThreadPoolExecutor(max_workers=len(TESSDATA_MIRRORS))
+    try:
+        probes = [pool.submit(_probe_mirror, url) for url in TESSDATA_MIRRORS]
+        for probe in as_completed(probes):
+            try:
+                url = probe.result()
+            except Exception as e:
+                print(f"[Tesseract] Mirror unavailable: {e}")
+                continue
+            if _download_ranged(url, eng_file) or download_file(url, eng_file, "eng.traineddata"):
+                return True
+    finally:
+        # Don't wait on probes still hanging on a dead mirror
+        pool.shutdown(wait=False, cancel_futures=True)
 
     return False
 
@@ -219,31 +321,29 @@ def download_tesseract_portable() -> Optional[Path]:
     # 3. Extract from the installer using 7z
 
     # For now, let's check if user has Tesseract installed and copy from there
-    system_tesseract = shutil.which('tesseract')
-    if not system_tesseract:
-        # Check common paths
-        for path in [
-            r"C:\Program Files\Tesseract-OCR",
-            r"C:\Program Files (x86)\Tesseract-OCR",
-        ]:
-            if os.path.exists(os.path.join(path, 'tesseract.exe')):
-                system_tesseract = os.path.join(path, 'tesseract.exe')
-                break
-
-    if system_tesseract:
+    # Same PATH / common-location search as get_tesseract_cmd(); 'tesseract' means not found
+    system_tesseract = get_tesseract_cmd()
+
+    if system_tesseract != 'tesseract':
         # Copy from system installation
         src_dir = Path(system_tesseract).parent
         print(f"[Tesseract] Copying from system: {src_dir}")
 
         try:
-            # Copy exe
-            shutil.copy2(src_dir / 'tesseract.exe', tesseract_dir / 'tesseract.exe')
-
-            # Copy DLLs
-            for dll in src_dir.glob('*.dll'):
-                shutil.copy2(dll, tesseract_dir / dll.name)
+            # Copy DLLs (I/O bound, so in parallel)
+            with os.scandir(src_dir) as it:
+                dlls = [e.name for e in it if e.name.lower().endswith('.dll')]
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(
+                    lambda name: shutil.copyfile(src_dir / name, tesseract_dir / name),
+                    dlls,
+                ))
+
+            # Copy exe last: its presence marks the install as complete
+            shutil.copyfile(src_dir / 'tesseract.exe', tesseract_dir / 'tesseract.exe')
 
             print(f"[Tesseract] Copied to: {tesseract_dir}")
+            _invalidate_tesseract_cache()
             return tesseract_dir
 
         except Exception as e:
@@ -1,9 +1,12 @@
 # bb_detector/tray.py
 import platform
 import threading
-from typing import Callable, Optional
-from PIL import Image, ImageDraw
-import pystray
+from typing import TYPE_CHECKING, Callable, Optional
+
+# PIL and pystray are imported on first use so importing this module stays cheap
+if TYPE_CHECKING:
+    from PIL import Image
+    import pystray
 
 IS_MACOS = platform.system() == 'Darwin'
 
@@ -23,11 +26,21 @@ class TrayIcon:
 
         self._connected = False
         self._detection_enabled = True
-        self._icon: Optional[pystray.Icon] = None
+        self._icon: Optional['pystray.Icon'] = None
         self._thread: Optional[threading.Thread] = None
         self._is_running = False
+        # Only two possible icons; render each once
+        self._icon_images: dict = {}
+
+    def _icon_image(self, connected: bool) -> 'Image.Image':
+        img = self._icon_images.get(connected)
+        if img is None:
+            img = self._icon_images[connected] = self._create_icon_image(connected)
+        return img
+
+    def _create_icon_image(self, connected: bool) -> 'Image.Image':
+        from PIL import Image, ImageDraw
 
-    def _create_icon_image(self, connected: bool) -> Image.Image:
         size = 64
         img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
@@ -41,7 +54,9 @@ class TrayIcon:
 
         return img
 
-    def _create_menu(self) -> pystray.Menu:
+    def _create_menu(self) -> 'pystray.Menu':
+        import pystray
+
         return pystray.Menu(
             pystray.MenuItem(
                 'Toggle Detection',
@@ -75,9 +90,11 @@ class TrayIcon:
         On macOS, uses run_detached() to avoid threading issues with AppKit.
         On other platforms, runs in a daemon thread.
         """
+        import pystray
+
         self._icon = pystray.Icon(
             'BB Detector',
-            self._create_icon_image(self._connected),
+            self._icon_image(self._connected),
             'BB Death Detector',
             menu=self._create_menu()
         )
@@ -99,9 +116,10 @@ class TrayIcon:
             self._icon = None
 
     def set_connected(self, connected: bool):
+        changed = connected != self._connected
         self._connected = connected
-        if self._icon:
-            self._icon.icon = self._create_icon_image(connected)
+        if self._icon and changed:
+            self._icon.icon = self._icon_image(connected)
 
     def notify(self, message: str, title: str = "BB Detector"):
         if self._icon:
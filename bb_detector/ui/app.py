@@ -3,6 +3,7 @@
 import dearpygui.dearpygui as dpg
 from typing import Optional, Callable
 from pathlib import Path
+import logging
 import sys
 
 from .theme import (
@@ -19,6 +20,8 @@ from .dialogs.profile import ProfileDialog
 from ..state import StateManager
 from ..config import Config
 
+log = logging.getLogger(__name__)
+
 
 class App:
     """Main application window manager with sidebar navigation."""
@@ -55,6 +58,8 @@ class App:
         # Stats callbacks
         on_add_stats: Callable = None,
         on_delete_stats: Callable = None,
+        # Called after Setup writes settings to config
+        on_settings_saved: Callable = None,
     ):
         self.config = config
         self.state = state
@@ -80,6 +85,7 @@ class App:
         self._on_delete_milestone = on_delete_milestone or (lambda i: None)
         self._on_add_stats = on_add_stats or (lambda s: None)
         self._on_delete_stats = on_delete_stats or (lambda i: None)
+        self._on_settings_saved = on_settings_saved or (lambda: None)
 
         # UI components (sections instead of tabs)
         self.play_section: Optional[PlaySection] = None
@@ -97,6 +103,8 @@ class App:
 
         self._is_compact = False
         self._running = False
+        # StateManager.version last drawn (-1: nothing drawn yet)
+        self._drawn_version = -1
 
     def _load_fonts(self):
         """Load fonts with Cyrillic support."""
@@ -127,7 +135,7 @@ class App:
                 break
 
         if not font_path:
-            print("[UI] No Cyrillic font found, using default", flush=True)
+            log.info("[UI] No Cyrillic font found, using default")
             return
 
         try:
@@ -140,9 +148,9 @@ class App:
                     dpg.add_font_range_hint(dpg.mvFontRangeHint_Default)
 
                 dpg.bind_font(font)
-                print(f"[UI] Loaded font: {font_path}", flush=True)
+                log.info(f"[UI] Loaded font: {font_path}")
         except Exception as e:
-            print(f"[UI] Font loading failed: {e}", flush=True)
+            log.warning(f"[UI] Font loading failed: {e}")
 
     def init(self):
         """Initialize DearPyGui and create windows."""
@@ -151,12 +159,14 @@ class App:
         # Load font with Cyrillic support
         self._load_fonts()
 
-        # Create viewport
+        # Create viewport. Frames are paced by the main loop at ui.fps, so
+        # vsync would only park the event loop thread in the buffer swap.
         dpg.create_viewport(
             title="BB Death Detector",
             width=self.FULL_WIDTH,
             height=self.FULL_HEIGHT,
             resizable=False,
+            vsync=self.config.get('ui.vsync', False),
         )
 
         # Apply theme
@@ -175,9 +185,6 @@ class App:
         self.compact_window = CompactWindow(on_expand=self._switch_to_full)
         self.compact_window.create()
 
-        # Subscribe to state changes
-        self.state.subscribe(self._on_state_change)
-
         # Setup
         dpg.setup_dearpygui()
         dpg.show_viewport()
@@ -381,6 +388,7 @@ class App:
         for key, value in settings.items():
             self.config.set(key, value)
         self.config.save()
+        self._on_settings_saved()
 
     def _switch_to_compact(self):
         """Switch to compact mode."""
@@ -408,11 +416,6 @@ class App:
         if self.setup_section:
             self.setup_section.on_f9_pressed()
 
-    def _on_state_change(self, key: str, value):
-        """Handle state changes."""
-        # Update UI based on state
-        self._update_ui()
-
     def _update_ui(self):
         """Update all UI elements from state."""
         # Update play section
@@ -476,6 +479,14 @@ class App:
             # Process pending updates from setup section (thread-safe)
             if self.setup_section:
                 self.setup_section.update()
+
+            # Redraw from state once per frame, however many changes landed
+            # since the last one (and always on the render thread)
+            version = self.state.version
+            if version != self._drawn_version:
+                self._drawn_version = version
+                self._update_ui()
+
             dpg.render_dearpygui_frame()
 
     def is_running(self) -> bool:
@@ -37,6 +37,8 @@ class CompactWindow:
         self._position = [50, 50]
         self._boss_mode = False
         self._boss_paused = False
+        # Values last written to the widgets (update() skips repeats)
+        self._shown: Optional[tuple] = None
 
         # Themes
         self._accent_theme = None
@@ -45,6 +47,8 @@ class CompactWindow:
 
     def create(self):
         """Create the compact window (hidden initially)."""
+        self._shown = None
+
         # Create button themes
         self._accent_theme = create_accent_button_theme()
         self._boss_theme = create_boss_button_theme()
@@ -179,39 +183,51 @@ class CompactWindow:
         self._boss_mode = boss_mode
         self._boss_paused = boss_paused
 
+        # Timer shows whole seconds; sub-second ticks change nothing on screen
+        shown = (deaths, elapsed // 1000, boss_mode, boss_deaths, connected,
+                 profile, boss_paused)
+        last = self._shown if self._shown is not None else (None,) * len(shown)
+        if shown == last:
+            return
+        self._shown = shown
+        (last_deaths, last_seconds, last_boss_mode, last_boss_deaths, last_connected,
+         last_profile, last_paused) = last
+
         # Deaths counter
-        if dpg.does_item_exist("compact_deaths"):
+        if deaths != last_deaths and dpg.does_item_exist("compact_deaths"):
             dpg.set_value("compact_deaths", str(deaths))
 
         # Timer
-        if dpg.does_item_exist("compact_timer"):
+        if shown[1] != last_seconds and dpg.does_item_exist("compact_timer"):
             hours = elapsed // 3600000
             minutes = (elapsed % 3600000) // 60000
             seconds = (elapsed % 60000) // 1000
             dpg.set_value("compact_timer", f"{hours:02d}:{minutes:02d}:{seconds:02d}")
 
         # Boss mode UI
-        self._update_boss_ui(boss_mode, boss_deaths, boss_paused)
+        if (boss_mode, boss_deaths, boss_paused) != (last_boss_mode, last_boss_deaths, last_paused):
+            self._update_boss_ui(boss_mode, boss_deaths, boss_paused)
 
         # Connection status
-        if dpg.does_item_exist("compact_status_dot"):
-            if connected:
-                dpg.set_value("compact_status_dot", "●")
-                dpg.configure_item("compact_status_dot", color=COLORS['green'])
-            else:
-                dpg.set_value("compact_status_dot", "●")
-                dpg.configure_item("compact_status_dot", color=COLORS['text_tertiary'])
-
-        if dpg.does_item_exist("compact_status_text"):
-            if connected:
-                dpg.set_value("compact_status_text", "Online")
-                dpg.configure_item("compact_status_text", color=COLORS['green'])
-            else:
-                dpg.set_value("compact_status_text", "Offline")
-                dpg.configure_item("compact_status_text", color=COLORS['text_tertiary'])
+        if connected != last_connected:
+            if dpg.does_item_exist("compact_status_dot"):
+                if connected:
+                    dpg.set_value("compact_status_dot", "●")
+                    dpg.configure_item("compact_status_dot", color=COLORS['green'])
+                else:
+                    dpg.set_value("compact_status_dot", "●")
+                    dpg.configure_item("compact_status_dot", color=COLORS['text_tertiary'])
+
+            if dpg.does_item_exist("compact_status_text"):
+                if connected:
+                    dpg.set_value("compact_status_text", "Online")
+                    dpg.configure_item("compact_status_text", color=COLORS['green'])
+                else:
+                    dpg.set_value("compact_status_text", "Offline")
+                    dpg.configure_item("compact_status_text", color=COLORS['text_tertiary'])
 
         # Profile name
-        if dpg.does_item_exist("compact_profile"):
+        if profile != last_profile and dpg.does_item_exist("compact_profile"):
             dpg.set_value("compact_profile", profile if profile else "")
 
     def _update_boss_ui(self, boss_mode: bool, boss_deaths: int, boss_paused: bool):
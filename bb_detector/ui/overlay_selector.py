@@ -76,10 +76,10 @@ class OverlayRegionSelector:
                 print("[OverlaySelector] Subprocess started, waiting for result...", flush=True)
 
                 # Poll for result file with timeout
-                start_time = time.time()
+                start_time = time.monotonic()
                 timeout = 120  # 2 minutes
 
-                while time.time() - start_time < timeout:
+                while time.monotonic() - start_time < timeout:
                     # Check if process finished
                     poll_result = proc.poll()
                     if poll_result is not None:
@@ -1,7 +1,7 @@
 # bb_detector/ui/sections/history.py
 """History section - merged history + stats for sidebar navigation."""
 import dearpygui.dearpygui as dpg
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 from ..theme import (
     COLORS,
     create_accent_button_theme,
@@ -46,6 +46,11 @@ class HistorySection:
         self._deaths: int = 0
         self._elapsed: int = 0
 
+        # List objects last drawn into each list widget. StateManager keeps
+        # the same list while the server's copy is unchanged, so identity
+        # tells whether a list needs rebuilding.
+        self._drawn: Dict[str, list] = {}
+
         self._accent_theme: Optional[int] = None
         self._card_theme: Optional[int] = None
         self._container_tag = "history_section_container"
@@ -57,6 +62,7 @@ class HistorySection:
         """Create the History section content."""
         self._accent_theme = create_accent_button_theme()
         self._card_theme = create_section_card_theme()
+        self._drawn = {}
 
         with dpg.child_window(
             tag=self._container_tag,
@@ -152,10 +158,21 @@ class HistorySection:
         self._character_stats = character_stats
 
         self._update_session_card()
-        self._update_milestones_list()
-        self._update_stats_list()
-        self._update_bosses_list()
-        self._update_deaths_list()
+
+        # Lists are rebuilt item by item - skip the ones that didn't change
+        drawn = self._drawn
+        if drawn.get('milestones') is not milestones:
+            self._update_milestones_list()
+            drawn['milestones'] = milestones
+        if drawn.get('character_stats') is not character_stats:
+            self._update_stats_list()
+            drawn['character_stats'] = character_stats
+        if drawn.get('boss_fights') is not boss_fights:
+            self._update_bosses_list()
+            drawn['boss_fights'] = boss_fights
+        if drawn.get('death_timestamps') is not death_timestamps:
+            self._update_deaths_list()
+            drawn['death_timestamps'] = death_timestamps
 
     def show(self):
         """Show the history section."""
@@ -1,7 +1,7 @@
 # bb_detector/ui/sections/play.py
 """Play section - main gameplay controls with card-based layout."""
 import dearpygui.dearpygui as dpg
-from typing import Callable
+from typing import Callable, Optional
 from ..theme import (
     COLORS,
     create_accent_button_theme,
@@ -44,6 +44,8 @@ class PlaySection:
         self._card_theme = None
         self._boss_paused = False
         self._container_tag = "play_section_container"
+        # Values last written to the widgets (update() skips repeats)
+        self._shown: Optional[tuple] = None
 
     def create(self, parent: str):
         """Create the Play section content with card-based layout."""
@@ -51,6 +53,7 @@ class PlaySection:
         self._success_theme = create_success_button_theme()
         self._boss_theme = create_boss_button_theme()
         self._card_theme = create_section_card_theme()
+        self._shown = None
 
         with dpg.child_window(
             parent=parent,
@@ -246,26 +249,38 @@ class PlaySection:
         boss_paused: bool,
         detection_enabled: bool,
     ):
-        """Update all displays."""
+        """Update the displays whose values changed since the last call."""
+        # Timer shows whole seconds; sub-second ticks change nothing on screen
+        shown = (deaths, elapsed // 1000, is_running, boss_mode, boss_deaths,
+                 boss_paused, detection_enabled)
+        last = self._shown if self._shown is not None else (None,) * len(shown)
+        if shown == last:
+            return
+        self._shown = shown
+        (last_deaths, last_seconds, last_running, last_boss_mode, last_boss_deaths,
+         last_paused, last_detection) = last
+
         # Deaths counter
-        if dpg.does_item_exist("play_deaths_display"):
+        if deaths != last_deaths and dpg.does_item_exist("play_deaths_display"):
             dpg.set_value("play_deaths_display", str(deaths))
 
         # Timer display
-        if dpg.does_item_exist("play_timer_display"):
+        if shown[1] != last_seconds and dpg.does_item_exist("play_timer_display"):
             hours = elapsed // 3600000
             minutes = (elapsed % 3600000) // 60000
             seconds = (elapsed % 60000) // 1000
             dpg.set_value("play_timer_display", f"{hours:02d}:{minutes:02d}:{seconds:02d}")
 
         # Timer buttons state
-        if dpg.does_item_exist("play_timer_start_btn"):
-            dpg.configure_item("play_timer_start_btn", enabled=not is_running)
-        if dpg.does_item_exist("play_timer_stop_btn"):
-            dpg.configure_item("play_timer_stop_btn", enabled=is_running)
+        if is_running != last_running:
+            if dpg.does_item_exist("play_timer_start_btn"):
+                dpg.configure_item("play_timer_start_btn", enabled=not is_running)
+            if dpg.does_item_exist("play_timer_stop_btn"):
+                dpg.configure_item("play_timer_stop_btn", enabled=is_running)
 
         # Boss status
-        if dpg.does_item_exist("play_boss_status"):
+        boss_changed = boss_mode != last_boss_mode
+        if (boss_changed or boss_paused != last_paused) and dpg.does_item_exist("play_boss_status"):
             if boss_mode:
                 if boss_paused:
                     dpg.set_value("play_boss_status", "PAUSED")
@@ -279,21 +294,22 @@ class PlaySection:
 
         # Boss pause button label
         self._boss_paused = boss_paused
-        if dpg.does_item_exist("play_boss_pause_btn"):
+        if boss_paused != last_paused and dpg.does_item_exist("play_boss_pause_btn"):
             dpg.set_item_label("play_boss_pause_btn", "Resume" if boss_paused else "Pause")
 
         # Boss deaths counter
-        if dpg.does_item_exist("play_boss_deaths_display"):
+        if boss_deaths != last_boss_deaths and dpg.does_item_exist("play_boss_deaths_display"):
             dpg.set_value("play_boss_deaths_display", str(boss_deaths))
 
         # Toggle boss button groups
-        if dpg.does_item_exist("play_boss_buttons_inactive"):
-            dpg.configure_item("play_boss_buttons_inactive", show=not boss_mode)
-        if dpg.does_item_exist("play_boss_buttons_active"):
-            dpg.configure_item("play_boss_buttons_active", show=boss_mode)
+        if boss_changed:
+            if dpg.does_item_exist("play_boss_buttons_inactive"):
+                dpg.configure_item("play_boss_buttons_inactive", show=not boss_mode)
+            if dpg.does_item_exist("play_boss_buttons_active"):
+                dpg.configure_item("play_boss_buttons_active", show=boss_mode)
 
         # Detection status
-        if dpg.does_item_exist("play_detection_status"):
+        if detection_enabled != last_detection and dpg.does_item_exist("play_detection_status"):
             if detection_enabled:
                 dpg.set_value("play_detection_status", "ON")
                 dpg.configure_item("play_detection_status", color=COLORS['green'])
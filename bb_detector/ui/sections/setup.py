@@ -1,5 +1,6 @@
 # bb_detector/ui/sections/setup.py
 """Setup section - merged settings + calibration functionality."""
+import logging
 import dearpygui.dearpygui as dpg
 from typing import Callable, Optional, Dict, Any, List
 import numpy as np
@@ -10,6 +11,8 @@ from ..theme import COLORS, create_card_theme
 from ..corner_selector import CornerSelector
 from ..overlay_selector import show_overlay_selector
 
+log = logging.getLogger(__name__)
+
 
 def _get_monitor_list() -> List[str]:
     """Get list of available monitors."""
@@ -401,7 +404,8 @@ class SetupSection:
     def _on_capture_and_test(self):
         """Capture region and test detection."""
         region = self._get_region_for_capture()
-        frame = self.on_capture_region(region)
+        # Kept as _captured_frame, so it must not alias the capture buffer
+        frame = self.on_capture_region(region, copy=True)
 
         if frame is None:
             if dpg.does_item_exist("setup_detection_result"):
@@ -489,7 +493,7 @@ class SetupSection:
                 dpg.set_value("setup_detection_details", details)
 
         except Exception as e:
-            print(f"[SetupSection] Live debug error: {e}", flush=True)
+            log.warning(f"[SetupSection] Live debug error: {e}")
 
     # === Settings ===
 
@@ -1,11 +1,15 @@
 # bb_detector/websocket_client.py
 import asyncio
 import json
+import logging
+import random
 from typing import Callable, Optional, Dict
 
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+log = logging.getLogger(__name__)
+
 
 class BBWebSocket:
     """WebSocket client for Bloodborne death tracker.
@@ -19,6 +23,14 @@ class BBWebSocket:
 
     WS_URL = "wss://soulsdeaths.somework.dev/ws"
 
+    # Reconnect backoff (same shape as the websockets library's): the first
+    # retry waits a random 0..BACKOFF_INITIAL s so clients dropped together
+    # don't reconnect together, later ones grow from BACKOFF_MIN to BACKOFF_MAX
+    BACKOFF_INITIAL = 5.0
+    BACKOFF_MIN = 1.92
+    BACKOFF_FACTOR = 1.618
+    BACKOFF_MAX = 60.0
+
     def __init__(
         self,
         profile: str,
@@ -33,12 +45,37 @@ class BBWebSocket:
         self.on_connect = on_connect
         self.on_disconnect = on_disconnect
 
-        # bloodborne=true routes to bloodborne-server.js via Caddy
-        self.url = f"{self.WS_URL}?bloodborne=true&profile={profile}"
+        self.url = self._build_url(profile)
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self.authenticated = False
         self._running = False
-        self._reconnect_delay = 3.0
+        # Next backoff delay; None until a reconnect attempt has failed
+        self._backoff: Optional[float] = None
+        # Set when we drop the connection on purpose (profile switch)
+        self._reconnect_now = False
+
+    def _build_url(self, profile: str) -> str:
+        # bloodborne=true routes to bloodborne-server.js via Caddy
+        return f"{self.WS_URL}?bloodborne=true&profile={profile}"
+
+    @property
+    def running(self) -> bool:
+        """Whether the connect() loop is active."""
+        return self._running
+
+    async def set_credentials(self, profile: str, password: str):
+        """Switch to another profile, reusing this client.
+
+        A running connect() loop reconnects immediately with the new profile.
+        """
+        self.profile = profile
+        self.password = password
+        self.url = self._build_url(profile)
+        self.authenticated = False
+
+        if self.ws:
+            self._reconnect_now = True
+            await self.ws.close()
 
     def _build_message(self, msg_type: str, **kwargs) -> str:
         data = {'type': msg_type, **kwargs}
@@ -49,19 +86,38 @@ class BBWebSocket:
 
         while self._running:
             try:
-                async with websockets.connect(self.url) as ws:
+                url = self.url
+                async with websockets.connect(url) as ws:
+                    if url != self.url:
+                        # Profile switched during the handshake
+                        continue
                     self.ws = ws
                     self.authenticated = False
+                    self._backoff = None
                     await self._handle_connection()
             except ConnectionClosed:
                 pass
             except Exception as e:
-                print(f"[WS] Connection error: {e}", flush=True)
+                log.warning(f"[WS] Connection error: {e}")
 
             if self._running:
+                self.ws = None
                 self.authenticated = False
                 self.on_disconnect()
-                await asyncio.sleep(self._reconnect_delay)
+                if self._reconnect_now:
+                    self._reconnect_now = False
+                else:
+                    await asyncio.sleep(self._next_backoff())
+
+    def _next_backoff(self) -> float:
+        """Delay before the next reconnect attempt."""
+        if self._backoff is None:
+            self._backoff = self.BACKOFF_MIN
+            return random.random() * self.BACKOFF_INITIAL
+
+        delay = self._backoff
+        self._backoff = min(delay * self.BACKOFF_FACTOR, self.BACKOFF_MAX)
+        return delay
 
     async def _handle_connection(self):
         self.on_connect()
@@ -90,12 +146,12 @@ class BBWebSocket:
         elif msg_type == 'bb-auth-result':
             self.authenticated = data.get('success', False)
             if self.authenticated:
-                print("[WS] Authenticated successfully", flush=True)
+                log.info("[WS] Authenticated successfully")
             else:
-                print(f"[WS] Auth failed: {data.get('error')}", flush=True)
+                log.warning(f"[WS] Auth failed: {data.get('error')}")
 
         elif msg_type == 'bb-error':
-            print(f"[WS] Error: {data.get('error')} ({data.get('code')})", flush=True)
+            log.warning(f"[WS] Error: {data.get('error')} ({data.get('code')})")
 
     async def _auth(self):
         """Authenticate with password to get edit permissions."""
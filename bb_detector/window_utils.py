@@ -1,9 +1,12 @@
 # bb_detector/window_utils.py
 """Cross-platform window utilities for macOS and Windows."""
+import logging
 from typing import Optional, Dict, Any, List
 import numpy as np
 from .platform_utils import get_platform
 
+log = logging.getLogger(__name__)
+
 
 def get_window_at_point(x: int, y: int) -> Optional[Dict[str, Any]]:
     """Find the window under the given screen coordinates.
@@ -540,7 +543,7 @@ def _capture_window_region_macos(
         return region
 
     except Exception as e:
-        print(f"[WindowCapture] macOS error: {e}", flush=True)
+        log.warning(f"[WindowCapture] macOS error: {e}")
         return None
 
 
@@ -646,5 +649,5 @@ def _capture_window_region_windows(
         return region
 
     except Exception as e:
-        print(f"[WindowCapture] Windows error: {e}", flush=True)
+        log.warning(f"[WindowCapture] Windows error: {e}")
         return None
@@ -23,3 +23,113 @@ def test_capture_resolution():
     assert isinstance(res, tuple)
     assert len(res) == 2
     assert res[0] > 0 and res[1] > 0
+
+def _bare_capture(**kwargs):
+    """ScreenCapture with no backend (stream and conversion helpers only)"""
+    from unittest.mock import patch
+    from bb_detector.capture import ScreenCapture
+
+    with patch.object(ScreenCapture, '_init_backend'):
+        return ScreenCapture(**kwargs)
+
+def test_capture_stream_never_overwrites_frame_being_read():
+    """_publish skips the buffer handed out by get_latest() and bumps seq"""
+    capture = _bare_capture()
+
+    capture._publish(np.full((4, 4), 1, dtype=np.uint8))
+    seq, reading = capture.get_latest()
+    assert seq == 1 and reading[0, 0] == 1
+
+    for value in range(2, 8):
+        capture._publish(np.full((4, 4), value, dtype=np.uint8))
+        assert not np.shares_memory(capture._stream_bufs[capture._stream_front], reading)
+        assert reading[0, 0] == 1
+
+    seq, latest = capture.get_latest()
+    assert seq == 7 and latest[0, 0] == 7
+
+def test_capture_stream_get_latest_before_first_frame():
+    """No frame yet: (0, None)"""
+    capture = _bare_capture()
+
+    assert capture.get_latest() == (0, None)
+
+def _fake_screenshot(bgra):
+    from types import SimpleNamespace
+
+    h, w = bgra.shape[:2]
+    return SimpleNamespace(size=(w, h), raw=bgra.tobytes())
+
+def test_capture_bgra_conversions():
+    """BGRA -> RGB/gray match OpenCV and reuse the output buffer"""
+    import cv2
+    from bb_detector.capture import ScreenCapture
+
+    rng = np.random.default_rng(0)
+    bgra = rng.integers(0, 256, (6, 5, 4), dtype=np.uint8)
+    shot = _fake_screenshot(bgra)
+
+    rgb = ScreenCapture._bgra_to_rgb(shot, None)
+    assert np.array_equal(rgb, bgra[..., 2::-1])
+    assert ScreenCapture._bgra_to_rgb(shot, rgb) is rgb
+
+    gray = ScreenCapture._bgra_to_gray(shot, None)
+    assert np.array_equal(gray, cv2.cvtColor(bgra, cv2.COLOR_BGRA2GRAY))
+    assert ScreenCapture._bgra_to_gray(shot, gray) is gray
+
+    crop = rgb[1:5, 1:4]  # strided view, as cropped regions are
+    assert np.array_equal(
+        ScreenCapture._rgb_to_gray(crop, None),
+        cv2.cvtColor(np.ascontiguousarray(crop), cv2.COLOR_RGB2GRAY)
+    )
+
+class _FakeCamera:
+    """DXGI camera stand-in: returns queued frames, then None (static screen)"""
+    width = 100
+    height = 50
+
+    def __init__(self, *frames):
+        self.frames = list(frames)
+        self.regions = []
+
+    def grab(self, region=None):
+        self.regions.append(region)
+        return self.frames.pop(0) if self.frames else None
+
+def test_capture_dxgi_clamps_region_to_output():
+    """Regions are clipped to the camera size; fully outside means no grab"""
+    capture = _bare_capture()
+    capture._camera = _FakeCamera(np.zeros((1, 1, 3), dtype=np.uint8))
+
+    capture._dxgi_grab((-10, 40, 120, 80))
+    assert capture._camera.regions == [(0, 40, 100, 50)]
+
+    assert capture._dxgi_grab((150, 0, 200, 10)) is None
+    assert len(capture._camera.regions) == 1
+
+def test_capture_dxgi_repeats_last_frame_per_region():
+    """A static screen returns the last frame for that same region only"""
+    a = np.zeros((2, 2, 3), dtype=np.uint8)
+    full = np.zeros((50, 100, 3), dtype=np.uint8)
+    capture = _bare_capture()
+    capture._camera = _FakeCamera(a, full)
+
+    assert capture._dxgi_grab((0, 0, 2, 2)) is a
+    assert capture._dxgi_grab(None) is full
+
+    assert capture._dxgi_grab((0, 0, 2, 2)) is a
+    assert capture._dxgi_grab(None) is full
+    assert capture._dxgi_grab((10, 10, 20, 20)) is None
+
+def test_capture_dxgi_evicts_oldest_region():
+    """Only the DXGI_LAST_FRAMES most recently used regions are kept"""
+    capture = _bare_capture()
+    n = capture.DXGI_LAST_FRAMES
+    regions = [(i, 0, i + 1, 1) for i in range(n + 1)]
+    capture._camera = _FakeCamera(*[np.zeros((1, 1, 3), dtype=np.uint8) for _ in regions])
+
+    for region in regions:
+        capture._dxgi_grab(region)
+
+    assert capture._dxgi_grab(regions[0]) is None
+    assert all(capture._dxgi_grab(r) is not None for r in regions[1:])
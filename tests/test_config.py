@@ -39,3 +39,67 @@ def test_config_save_and_load():
         config2 = Config(path)
         config2.load()
         assert config2.get('profile.name') == 'saved_user'
+
+def test_config_get_sees_updates_after_cached_read():
+    """Cached get() results are invalidated by set()"""
+    from bb_detector.config import Config
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(Path(tmpdir) / "config.json")
+
+        assert config.get('profile.name', 'fallback') == 'fallback'
+        assert config.get('detection.fps', 10) == 10
+
+        config.set('profile.name', 'cached_user')
+        config.set('detection.fps', 30)
+
+        assert config.get('profile.name', 'fallback') == 'cached_user'
+        assert config.get('detection.fps', 10) == 30
+        assert config.get('detection', {}) == {'fps': 30}
+
+def test_config_get_game_config_follows_current_game():
+    """get_game_config() returns the section for the current game"""
+    from bb_detector.config import Config
+
+    config = Config()
+    assert config.get_game_config() is config.get('games.Bloodborne')
+
+    config.set('current_game', 'Sekiro')
+    assert 'DEATH' in config.get_game_config()['keywords']
+
+    config.set('current_game', 'Unknown Game')
+    assert config.get_game_config() == {}
+    assert config.settings['consecutive_hits'] == 2
+
+def test_config_view_returns_snapshot():
+    """view() returns a copy of a section, or {} if it is missing"""
+    from bb_detector.config import Config
+
+    config = Config()
+    hotkeys = config.view('hotkeys')
+    assert hotkeys['manual_death'] == 'ctrl+shift+d'
+
+    hotkeys['manual_death'] = 'f1'
+    assert config.get('hotkeys.manual_death') == 'ctrl+shift+d'
+    assert config.view('detection') == {}
+
+
+def test_config_dirty_tracking():
+    """dirty follows set() and clears on save()"""
+    from bb_detector.config import Config
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / 'config.json'
+        config = Config(path)
+        assert not config.dirty
+
+        config.set('profile.name', 'someone')
+        assert config.dirty
+        assert config.save_if_dirty()
+        assert not config.dirty
+        assert path.exists()
+        assert not path.with_name('config.json.tmp').exists()
+
+        path.unlink()
+        assert config.save_if_dirty()
+        assert not path.exists()
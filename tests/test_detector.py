@@ -29,3 +29,157 @@ def test_detector_check_death_no_match():
 
     assert is_dead == False
     assert confidence < 0.5
+
+def test_detector_contains_keyword_fuzzy():
+    """Keyword matching ignores punctuation and corrects common OCR digits"""
+    from bb_detector.detector import DeathDetector
+    from bb_detector.config import Config
+
+    detector = DeathDetector(Config())
+
+    assert detector._contains_keyword("  you died!\n")
+    assert detector._contains_keyword("Y0U D1ED")
+    assert not detector._contains_keyword("YOU WIN")
+
+    detector.fuzzy_matching = False
+    assert not detector._contains_keyword("Y0V D1ED")
+
+def test_detector_skips_ocr_on_blank_frame():
+    """Frames without any text-like pixels never reach tesseract"""
+    from unittest.mock import MagicMock
+    from bb_detector.detector import DeathDetector
+    from bb_detector.config import Config
+
+    detector = DeathDetector(Config())
+    detector._pytesseract = MagicMock()
+    detector._pil_image = MagicMock()
+
+    frame = np.zeros((200, 600, 3), dtype=np.uint8)
+
+    assert detector._ocr_detect(frame) == (False, '')
+    detector._pytesseract.image_to_string.assert_not_called()
+
+def test_detector_binarize_normalizes_text_polarity():
+    """Bright and dark text both come out as black ink on white"""
+    from bb_detector.detector import DeathDetector
+    from bb_detector.config import Config
+
+    detector = DeathDetector(Config())
+
+    light_on_dark = np.full((40, 200), 20, dtype=np.uint8)
+    light_on_dark[15:25, 50:150] = 60  # dim red "YOU DIED" in grayscale
+    dark_on_light = 255 - light_on_dark
+
+    for gray in (light_on_dark, dark_on_light):
+        binary, ink = detector._binarize(gray)
+        assert binary[20, 100] == 0
+        assert binary[0, 0] == 255
+        assert abs(ink - 0.125) < 1e-6
+
+def test_detector_caches_ocr_per_frame():
+    """Repeated frames reuse the OCR result but still build the streak"""
+    from unittest.mock import MagicMock
+    from bb_detector.detector import DeathDetector
+    from bb_detector.config import Config
+
+    detector = DeathDetector(Config())
+    detector._ocr_available = True
+    detector._ocr_detect = MagicMock(return_value=(True, 'YOU DIED'))
+
+    frame = np.zeros((40, 200), dtype=np.uint8)
+
+    assert detector.check_death(frame) == (False, 1.0)
+    assert detector.check_death(frame) == (True, 1.0)
+    detector._ocr_detect.assert_called_once()
+
+def test_detector_buffers_are_per_thread():
+    """Calibration on the UI thread never shares scratch buffers with the worker"""
+    import threading
+    from bb_detector.detector import DeathDetector
+    from bb_detector.config import Config
+
+    detector = DeathDetector(Config())
+    mine = detector._ensure_buffers((60, 200, 3))
+    assert detector._ensure_buffers((60, 200, 3))[0] is mine[0]
+
+    theirs = []
+    t = threading.Thread(target=lambda: theirs.extend(detector._ensure_buffers((60, 200, 3))))
+    t.start()
+    t.join()
+
+    assert all(a is not b for a, b in zip(mine, theirs))
+
+def test_detector_ocr_size_limits_downscale():
+    """Region crops shrink to ocr_max_height, full frames at most by half"""
+    from bb_detector.detector import DeathDetector
+    from bb_detector.config import Config
+
+    detector = DeathDetector(Config())
+    detector.ocr_max_height = 96
+    detector.ocr_min_height = 48
+
+    assert detector._ocr_size((150, 600)) == (96, 384)
+    assert detector._ocr_size((1080, 1920)) == (540, 960)
+    assert detector._ocr_size((24, 200)) == (48, 400)
+
+def test_detector_reload_replaces_stale_tess_apis(monkeypatch):
+    """After a game switch each pooled API is ended and re-created on next use"""
+    import tempfile
+    from types import SimpleNamespace
+    import bb_detector.detector as detector_mod
+    from bb_detector.detector import DeathDetector
+    from bb_detector.config import Config
+
+    created = []
+
+    class FakeAPI:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+            self.variables = {}
+            self.ended = False
+            created.append(self)
+
+        def SetVariable(self, name, value):
+            self.variables[name] = value
+
+        def SetImageBytes(self, *args):
+            pass
+
+        def GetUTF8Text(self):
+            return 'YOU DIED'
+
+        def End(self):
+            self.ended = True
+
+    monkeypatch.setattr(detector_mod, 'tesserocr', SimpleNamespace(PyTessBaseAPI=FakeAPI))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(Path(tmpdir) / "config.json")
+        detector = DeathDetector(config)
+        assert len(created) == detector.OCR_WORKERS
+        assert created[0].kwargs['psm'] == 6
+
+        config.set('current_game', 'Dark Souls 3')
+        detector.reload(config)
+
+        img = np.zeros((20, 60), dtype=np.uint8)
+        for _ in range(detector.OCR_WORKERS + 1):
+            assert detector._ocr_image(img) == 'YOU DIED'
+
+        old, new = created[:detector.OCR_WORKERS], created[detector.OCR_WORKERS:]
+        assert all(api.ended for api in old)
+        assert len(new) == detector.OCR_WORKERS
+        assert all(api.kwargs['psm'] == 7 and api.variables for api in new)
+
+def test_detector_keywords_without_ahocorasick(monkeypatch):
+    """pyahocorasick is optional: keyword matching falls back to substring checks"""
+    import bb_detector.detector as detector_mod
+    from bb_detector.detector import DeathDetector
+    from bb_detector.config import Config
+
+    monkeypatch.setattr(detector_mod, 'ahocorasick', None)
+    detector = DeathDetector(Config())
+
+    assert detector._kw_automaton is None
+    assert detector._contains_keyword("Y0U D1ED")
+    assert not detector._contains_keyword("YOU WIN")
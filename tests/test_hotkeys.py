@@ -70,3 +70,26 @@ def test_hotkeys_callback_execution():
     # Call the stored callback directly
     hotkeys.hotkeys[key_set]()
     assert test_value == [1]
+
+def test_hotkeys_repeat_press_fires_again():
+    """A key pressed again without a release (lost release event) still fires"""
+    from concurrent.futures import ThreadPoolExecutor
+    from bb_detector.hotkeys import GlobalHotkeys
+
+    class Key:
+        def __init__(self, char):
+            self.char = char
+
+    hotkeys = GlobalHotkeys()
+    fired = []
+    hotkeys.register('ctrl+d', lambda: fired.append(1))
+    executor = hotkeys._executor = ThreadPoolExecutor(max_workers=1)
+
+    hotkeys._on_press(Key('ctrl'))
+    hotkeys._on_press(Key('d'))
+    hotkeys._on_press(Key('d'))
+
+    hotkeys.stop()
+    executor.shutdown(wait=True)
+    assert fired == [1, 1]
+    assert hotkeys._executor is None
@@ -0,0 +1,234 @@
+# tests/test_main.py
+import pytest
+import numpy as np
+
+
+def _main():
+    # bb_detector.main pulls in pynput, which needs a display
+    return pytest.importorskip('bb_detector.main', exc_type=ImportError)
+
+
+def test_main_loop_reraises_tick_error():
+    """An exception in a tick reaches the caller of _main_loop"""
+    import asyncio
+    from unittest.mock import MagicMock
+    main = _main()
+
+    app = main.BBDetectorApp()
+    app.app = MagicMock()
+    app.app.render.side_effect = ValueError('render failed')
+    app._detection_interval = 0.001
+    app.running = True
+    app.loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(ValueError, match='render failed'):
+            app.loop.run_until_complete(app._main_loop())
+    finally:
+        app.loop.close()
+
+
+def test_capture_region_preview_uses_own_buffer():
+    """The live preview fills its own buffer; copy=True gets a fresh array"""
+    from unittest.mock import MagicMock
+    main = _main()
+
+    app = main.BBDetectorApp()
+    app.capture = MagicMock()
+    app.capture.grab_into.side_effect = lambda out=None: (
+        np.zeros((100, 200, 3), dtype=np.uint8) if out is None else out
+    )
+
+    preview = app._on_capture_region({})
+    assert app._on_capture_region({}) is preview
+    app.capture.grab.assert_not_called()
+
+    kept = app._on_capture_region({'x': 10, 'y': 20, 'width': 50, 'height': 30}, copy=True)
+    assert kept.shape == (30, 50, 3)
+    assert not np.shares_memory(kept, preview)
+
+
+def test_settings_save_reloads_death_cooldown():
+    """A cooldown changed in Setup applies without a restart"""
+    import tempfile
+    from pathlib import Path
+    from types import SimpleNamespace
+    from bb_detector.config import Config
+    main = _main()
+    from bb_detector.ui.app import App
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        app = main.BBDetectorApp()
+        app.config = Config(Path(tmpdir) / "config.json")
+        app._load_detection_settings()
+        assert app._death_cooldown == 5.0
+
+        ui = SimpleNamespace(config=app.config, _on_settings_saved=app._load_detection_settings)
+        App._save_settings(ui, {'detection.death_cooldown': 12.0})
+
+        assert app._death_cooldown == 12.0
+
+
+def _gate_app(main, hits=0):
+    """App with just what _frame_unchanged needs"""
+    from types import SimpleNamespace
+
+    app = main.BBDetectorApp()
+    app._diff_threshold = 2.0
+    app.detector = SimpleNamespace(consecutive_hits=hits)
+    return app
+
+
+def test_frame_unchanged_skips_identical_frame():
+    """The same frame twice: the second is skipped"""
+    main = _main()
+    app = _gate_app(main)
+    frame = np.random.default_rng(0).integers(0, 256, (60, 200), dtype=np.uint8)
+
+    assert not app._frame_unchanged(frame)
+    assert app._frame_unchanged(frame.copy())
+
+
+def test_frame_unchanged_processes_changed_frame():
+    """A mean change above diff_threshold is processed"""
+    main = _main()
+    app = _gate_app(main)
+    frame = np.full((60, 200), 100, dtype=np.uint8)
+
+    assert not app._frame_unchanged(frame)
+    assert app._frame_unchanged(frame + 1)
+    assert not app._frame_unchanged(frame + 5)
+
+
+def test_frame_unchanged_shape_change_counts_as_changed():
+    """Grayscale <-> RGB switches are never treated as unchanged"""
+    main = _main()
+    app = _gate_app(main)
+    gray = np.zeros((60, 200), dtype=np.uint8)
+
+    assert not app._frame_unchanged(gray)
+    assert not app._frame_unchanged(np.zeros((60, 200, 3), dtype=np.uint8))
+    assert not app._frame_unchanged(gray)
+
+
+def test_frame_unchanged_reruns_during_streak():
+    """While a streak is building the same frame is analyzed again"""
+    main = _main()
+    app = _gate_app(main, hits=1)
+    frame = np.zeros((60, 200), dtype=np.uint8)
+
+    assert not app._frame_unchanged(frame)
+    assert not app._frame_unchanged(frame)
+
+
+def test_region_grabber_plain_modes():
+    """Legacy region -> grab_region_gray; no region -> grab_gray"""
+    from unittest.mock import MagicMock
+    main = _main()
+
+    app = main.BBDetectorApp()
+    app.capture = MagicMock()
+
+    app._set_region(main.RegionSpec(legacy=(1, 2, 30, 40)))
+    app._grab_region()
+    app.capture.grab_region_gray.assert_called_once_with(1, 2, 30, 40)
+
+    app._set_region(main.RegionSpec())
+    assert app._grab_region is app.capture.grab_gray
+
+
+def test_region_grabber_window_mode_falls_back(monkeypatch):
+    """Window capture first, then the absolute fallback region"""
+    from unittest.mock import MagicMock
+    main = _main()
+
+    window_frame = np.zeros((10, 10), dtype=np.uint8)
+    window_grab = MagicMock(return_value=window_frame)
+    monkeypatch.setattr(main, 'capture_window_region', window_grab)
+    monkeypatch.setattr(main, 'find_window_by_name', lambda name: None)
+
+    app = main.BBDetectorApp()
+    app.capture = MagicMock()
+    app._set_region(main.RegionSpec(
+        window_name='game', x_pct=0.1, y_pct=0.2, w_pct=0.3, h_pct=0.4,
+        absolute=(5, 6, 70, 80),
+    ))
+
+    assert app._grab_region() is window_frame
+    window_grab.assert_called_once_with('game', 0.1, 0.2, 0.3, 0.4)
+    app.capture.grab_region_gray.assert_not_called()
+
+    window_grab.return_value = None
+    app._grab_region()
+    app.capture.grab_region_gray.assert_called_once_with(5, 6, 70, 80)
+
+
+def test_region_spec_from_config():
+    """RegionSpec reads window-relative, absolute and legacy settings"""
+    import tempfile
+    from pathlib import Path
+    from bb_detector.config import Config
+    main = _main()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(Path(tmpdir) / "config.json")
+        assert main.RegionSpec.from_config(config) == main.RegionSpec()
+
+        config.set('detection.region.window_name', 'game')
+        config.set('detection.region.w_percent', 0.5)
+        config.set('detection.region.h_percent', 0.25)
+        config.set('detection.region.absolute.x', 10)
+        config.set('detection.region.absolute.y', 20)
+        config.set('detection.region.absolute.width', 300)
+        config.set('detection.region.absolute.height', 0)
+        config.set('detection.region.x', 1)
+        config.set('detection.region.y', 2)
+        config.set('detection.region.width', 3)
+        config.set('detection.region.height', 4)
+
+        spec = main.RegionSpec.from_config(config)
+        assert spec.has_window_region
+        assert (spec.w_pct, spec.h_pct) == (0.5, 0.25)
+        assert spec.absolute is None  # zero height
+        assert spec.legacy == (1, 2, 3, 4)
+
+
+def test_rect_rejects_empty():
+    """_rect keeps positive-size rectangles only"""
+    main = _main()
+
+    assert main._rect(1, 2, 3, 4) == (1, 2, 3, 4)
+    assert main._rect(1, 2, 0, 4) is None
+    assert main._rect(1, 2, 3, -1) is None
+    assert not main.RegionSpec(window_name='game', w_pct=0.5).has_window_region
+
+
+def test_post_batches_wakeups_and_runs_in_order():
+    """A burst of posts shares one drain; calls run in posting order"""
+    import asyncio
+    from unittest.mock import MagicMock
+    main = _main()
+
+    app = main.BBDetectorApp()
+    loop = app.loop = asyncio.new_event_loop()
+    loop.call_soon_threadsafe = MagicMock(wraps=loop.call_soon_threadsafe)
+    calls = []
+
+    async def call(n):
+        calls.append(n)
+
+    try:
+        for n in range(3):
+            app._post(call, n)
+        assert app._drain_pending
+        loop.call_soon_threadsafe.assert_called_once()
+
+        loop.run_until_complete(asyncio.sleep(0.01))
+        assert calls == [0, 1, 2]
+        assert not app._drain_pending
+        assert not app._ws_tasks
+
+        app._post(call, 3)
+        loop.run_until_complete(asyncio.sleep(0.01))
+        assert calls == [0, 1, 2, 3]
+    finally:
+        loop.close()
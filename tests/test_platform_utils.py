@@ -48,3 +48,18 @@ def test_open_macos_permissions_macos():
             args = mock_run.call_args[0][0]
             assert 'open' in args
             assert 'systempreferences' in args[1]
+
+def test_check_macos_permissions_cached():
+    """check_macos_permissions probes once unless forced"""
+    import bb_detector.platform_utils as pu
+
+    probe = MagicMock(return_value={'screen': True, 'accessibility': False})
+    with patch.object(pu, 'get_platform', return_value='macos'), \
+            patch.object(pu, '_probe_macos_permissions', probe), \
+            patch.object(pu, '_macos_permissions', None):
+        assert pu.check_macos_permissions() == {'screen': True, 'accessibility': False}
+        pu.check_macos_permissions()
+        assert probe.call_count == 1
+
+        pu.check_macos_permissions(force=True)
+        assert probe.call_count == 2
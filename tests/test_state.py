@@ -49,3 +49,84 @@ def test_state_manager_update_from_server():
     assert state.boss_mode == True
     assert state.boss_deaths == 2
     assert state.can_edit == True
+
+
+def test_state_manager_flags_track_booleans():
+    """flags bitmask follows boolean state changes"""
+    from bb_detector.state import StateManager, FLAG_DETECTION, FLAG_CONNECTED, FLAG_BOSS
+
+    state = StateManager()
+    assert state.flags == FLAG_DETECTION
+
+    state.set('connected', True)
+    state.update_from_server({'bossFightMode': True})
+    assert state.flags == FLAG_DETECTION | FLAG_CONNECTED | FLAG_BOSS
+
+    state.set('detection_enabled', False)
+    state.set('boss_mode', False)
+    assert state.flags == FLAG_CONNECTED
+
+
+def test_state_manager_update_notifies_once():
+    """update() applies several keys with one batched notification"""
+    from bb_detector.state import StateManager, BATCH_KEY
+
+    state = StateManager()
+    notifications = []
+    state.subscribe(lambda key, val: notifications.append((key, val)))
+
+    state.update_from_server({'deaths': 3, 'milestones': []}, extra={'connected': True})
+    state.update({'connected': True, 'can_edit': False})
+
+    assert notifications == [(BATCH_KEY, {'deaths': 3, 'connected': True})]
+    assert state.connected == True
+
+
+def test_state_manager_keyed_subscribe():
+    """Keyed subscribers only hear about their key, batched or not"""
+    from bb_detector.state import StateManager
+
+    state = StateManager()
+    deaths = []
+    callback = lambda key, val: deaths.append((key, val))
+    state.subscribe(callback, key='deaths')
+
+    state.set('elapsed', 1000)
+    state.set('deaths', 1)
+    state.update({'deaths': 2, 'connected': True})
+    assert deaths == [('deaths', 1), ('deaths', 2)]
+
+    state.unsubscribe(callback, key='deaths')
+    state.set('deaths', 3)
+    assert len(deaths) == 2
+
+
+def test_state_manager_skips_unchanged_server_lists():
+    """An unchanged server list keeps the existing parsed list"""
+    from bb_detector.state import StateManager
+
+    state = StateManager()
+    milestones = [{'id': 'm1', 'name': 'Cleric Beast', 'timestamp': 1000}]
+
+    state.update_from_server({'milestones': milestones})
+    parsed = state.milestones
+    assert parsed[0].name == 'Cleric Beast'
+
+    state.update_from_server({'milestones': [dict(m) for m in milestones]})
+    assert state.milestones is parsed
+
+    state.update_from_server({'milestones': [{'id': 'm1', 'name': 'Father Gascoigne'}]})
+    assert state.milestones[0].name == 'Father Gascoigne'
+
+
+def test_state_manager_version_counts_changes():
+    """version increases on real changes only"""
+    from bb_detector.state import StateManager
+
+    state = StateManager()
+    start = state.version
+
+    state.set('deaths', 1)
+    state.set('deaths', 1)
+    state.update({'deaths': 2, 'elapsed': 500})
+    assert state.version == start + 3
@@ -0,0 +1,129 @@
+# tests/test_tesseract_utils.py
+import pytest
+import tempfile
+from pathlib import Path
+
+
+class FakeResponse:
+    def __init__(self, body=b'', status_code=200, headers=None, url='https://example.com/eng'):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.url = url
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise OSError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+
+class FakeSession:
+    """Serves DATA; get_handler(range_header) builds the GET response"""
+
+    def __init__(self, data, get_handler, accept_ranges=True):
+        self.data = data
+        self.get_handler = get_handler
+        self.accept_ranges = accept_ranges
+
+    def head(self, url, **kwargs):
+        headers = {'Content-Length': str(len(self.data))}
+        if self.accept_ranges:
+            headers['Accept-Ranges'] = 'bytes'
+        return FakeResponse(headers=headers)
+
+    def get(self, url, headers=None, **kwargs):
+        return self.get_handler((headers or {}).get('Range'))
+
+
+DATA = bytes(range(256)) * 40
+
+
+def _ranged(rng):
+    lo, hi = map(int, rng.removeprefix('bytes=').split('-'))
+    return DATA[lo:hi + 1]
+
+
+def _use_session(monkeypatch, session):
+    from bb_detector import tesseract_utils
+    monkeypatch.setattr(tesseract_utils, '_http_session', lambda: session)
+
+
+def test_download_file_short_body_leaves_no_file(monkeypatch):
+    """A body shorter than Content-Length fails and removes the partial file"""
+    from bb_detector.tesseract_utils import download_file
+
+    _use_session(monkeypatch, FakeSession(DATA, lambda rng: FakeResponse(
+        DATA[:-10], headers={'Content-Length': str(len(DATA))}
+    )))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dest = Path(tmpdir) / 'eng.traineddata'
+        assert download_file('https://example.com/eng', dest) is False
+        assert not dest.exists()
+
+
+def test_download_file_writes_full_body(monkeypatch):
+    """A complete body is written as-is"""
+    from bb_detector.tesseract_utils import download_file
+
+    _use_session(monkeypatch, FakeSession(DATA, lambda rng: FakeResponse(
+        DATA, headers={'Content-Length': str(len(DATA))}
+    )))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dest = Path(tmpdir) / 'eng.traineddata'
+        assert download_file('https://example.com/eng', dest) is True
+        assert dest.read_bytes() == DATA
+
+
+def test_download_ranged_assembles_parts(monkeypatch):
+    """Parts fetched with Range requests land at their offsets"""
+    from bb_detector.tesseract_utils import _download_ranged
+
+    _use_session(monkeypatch, FakeSession(
+        DATA, lambda rng: FakeResponse(_ranged(rng), status_code=206)
+    ))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dest = Path(tmpdir) / 'eng.traineddata'
+        assert _download_ranged('https://example.com/eng', dest, n_chunks=3) is True
+        assert dest.read_bytes() == DATA
+
+
+@pytest.mark.parametrize('get_handler', [
+    # Server ignored the Range header and sent the whole file
+    lambda rng: FakeResponse(DATA, status_code=200),
+    # Part shorter than the requested range
+    lambda rng: FakeResponse(_ranged(rng)[:-1], status_code=206),
+])
+def test_download_ranged_rejects_bad_parts(monkeypatch, get_handler):
+    """A 200 reply or a short part fails and removes the file"""
+    from bb_detector.tesseract_utils import _download_ranged
+
+    _use_session(monkeypatch, FakeSession(DATA, get_handler))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dest = Path(tmpdir) / 'eng.traineddata'
+        assert _download_ranged('https://example.com/eng', dest) is False
+        assert not dest.exists()
+
+
+def test_download_ranged_needs_range_support(monkeypatch):
+    """Without Accept-Ranges the caller's single-stream fallback is used"""
+    from bb_detector.tesseract_utils import _download_ranged
+
+    _use_session(monkeypatch, FakeSession(DATA, lambda rng: None, accept_ranges=False))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        dest = Path(tmpdir) / 'eng.traineddata'
+        assert _download_ranged('https://example.com/eng', dest) is False
+        assert not dest.exists()
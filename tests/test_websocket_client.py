@@ -31,3 +31,35 @@ def test_websocket_message_builders():
     victory_msg = ws._build_message('bb-boss-victory', name='Test Boss')
     assert '"type": "bb-boss-victory"' in victory_msg
     assert '"name": "Test Boss"' in victory_msg
+
+def test_websocket_set_credentials_switches_profile():
+    """set_credentials updates profile, password and URL in place"""
+    import asyncio
+    from bb_detector.websocket_client import BBWebSocket
+
+    ws = BBWebSocket('old', 'pass', lambda s: None, lambda: None, lambda: None)
+    ws.authenticated = True
+
+    asyncio.run(ws.set_credentials('newprofile', 'newpass'))
+
+    assert ws.profile == 'newprofile'
+    assert ws.password == 'newpass'
+    assert 'profile=newprofile' in ws.url
+    assert ws.authenticated == False
+    assert ws.running == False
+
+def test_websocket_backoff_grows_and_resets():
+    """Reconnect delay starts jittered, grows to the cap, resets on connect"""
+    from bb_detector.websocket_client import BBWebSocket
+
+    ws = BBWebSocket('test', 'pass', lambda s: None, lambda: None, lambda: None)
+
+    assert 0 <= ws._next_backoff() <= ws.BACKOFF_INITIAL
+    assert ws._next_backoff() == ws.BACKOFF_MIN
+    assert ws._next_backoff() == ws.BACKOFF_MIN * ws.BACKOFF_FACTOR
+
+    delays = [ws._next_backoff() for _ in range(20)]
+    assert max(delays) == ws.BACKOFF_MAX
+
+    ws._backoff = None  # what a successful connect does
+    assert ws._next_backoff() <= ws.BACKOFF_INITIAL